@@ -0,0 +1,44 @@
+"""replace single-column strava_activities indexes with (user_id, start_date) composites
+
+Activity lists, profile recalculation and incremental sync all filter by
+user_id (optionally activity_type) and order by start_date DESC. Composite
+indexes serve these as one ordered range scan instead of index scan + sort.
+
+Revision ID: 020_strava_act_indexes
+Revises: 019_runner_source
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "020_strava_act_indexes"
+down_revision: Union[str, None] = "019_runner_source"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_strava_act_user_date", "strava_activities", ["user_id", "start_date"],
+    )
+    op.create_index(
+        "ix_strava_act_user_type_date", "strava_activities",
+        ["user_id", "activity_type", "start_date"],
+    )
+    # Superseded: user_id is the leading column of both composites.
+    op.drop_index("ix_strava_activities_user_id", table_name="strava_activities")
+    op.drop_index("ix_strava_activities_start_date", table_name="strava_activities")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_strava_activities_start_date", "strava_activities", ["start_date"],
+    )
+    op.create_index(
+        "ix_strava_activities_user_id", "strava_activities", ["user_id"],
+    )
+    op.drop_index("ix_strava_act_user_type_date", table_name="strava_activities")
+    op.drop_index("ix_strava_act_user_date", table_name="strava_activities")
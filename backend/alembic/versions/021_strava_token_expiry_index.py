@@ -0,0 +1,29 @@
+"""add index on strava_tokens.expires_at
+
+Lets "tokens expiring before T" (StravaToken.is_expired in SQL) run as an
+index range scan for bulk token refresh.
+
+Revision ID: 021_strava_token_expiry
+Revises: 020_strava_act_indexes
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "021_strava_token_expiry"
+down_revision: Union[str, None] = "020_strava_act_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_strava_tokens_expires_at", "strava_tokens", ["expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_strava_tokens_expires_at", table_name="strava_tokens")
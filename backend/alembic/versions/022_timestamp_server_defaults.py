@@ -0,0 +1,55 @@
+"""move created_at/updated_at/synced_at defaults to the database
+
+Timestamp defaults were Python-side (datetime.utcnow per row). They are now
+server defaults producing the same naive-UTC value, and updated_at is set
+by the UPDATE statement itself. Existing rows are unchanged.
+
+Revision ID: 022_timestamp_defaults
+Revises: 021_strava_token_expiry
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "022_timestamp_defaults"
+down_revision: Union[str, None] = "021_strava_token_expiry"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+UTC_NOW = sa.text("timezone('UTC', now())")
+
+# table -> timestamp columns that get a server default
+TIMESTAMP_COLUMNS = {
+    "users": ["created_at", "updated_at"],
+    "notifications": ["created_at"],
+    "gpx_files": ["created_at"],
+    "predictions": ["created_at"],
+    "strava_tokens": ["created_at", "updated_at"],
+    "strava_activities": ["synced_at"],
+    "user_hiking_profiles": ["created_at", "updated_at"],
+    "user_run_profiles": ["created_at", "updated_at"],
+    "profile_snapshots": ["created_at"],
+    "clubs": ["created_at", "updated_at"],
+    "runners": ["created_at", "updated_at"],
+    "races": ["created_at"],
+    "user_race_results": ["created_at"],
+    "runner_name_aliases": ["created_at"],
+    "club_name_aliases": ["created_at"],
+}
+
+
+def upgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=UTC_NOW)
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, server_default=None)
@@ -0,0 +1,36 @@
+"""add content_encoding and stored_size to gpx_files
+
+New uploads store gpx_content zlib-compressed. Existing rows keep
+content_encoding NULL and are read back as raw bytes.
+
+Revision ID: 023_gpx_content_encoding
+Revises: 022_timestamp_defaults
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "023_gpx_content_encoding"
+down_revision: Union[str, None] = "022_timestamp_defaults"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "gpx_files",
+        sa.Column("content_encoding", sa.String(length=8), nullable=True),
+    )
+    op.add_column(
+        "gpx_files",
+        sa.Column("stored_size", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("gpx_files", "stored_size")
+    op.drop_column("gpx_files", "content_encoding")
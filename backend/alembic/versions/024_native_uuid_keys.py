@@ -0,0 +1,84 @@
+"""convert String(36) UUID keys to native uuid
+
+users.id, gpx_files.id, predictions.id and every column referencing them
+were varchar(36). Native uuid is 16 bytes and compares as a fixed-width
+value, which shrinks the primary keys and all user_id indexes.
+
+Foreign keys are dropped around the type change and recreated with the
+same names.
+
+Revision ID: 024_native_uuid_keys
+Revises: 023_gpx_content_encoding
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "024_native_uuid_keys"
+down_revision: Union[str, None] = "023_gpx_content_encoding"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (constraint name, table, column, referenced table)
+FOREIGN_KEYS = [
+    ("gpx_files_user_id_fkey", "gpx_files", "user_id", "users"),
+    ("predictions_gpx_file_id_fkey", "predictions", "gpx_file_id", "gpx_files"),
+    ("predictions_user_id_fkey", "predictions", "user_id", "users"),
+    ("strava_tokens_user_id_fkey", "strava_tokens", "user_id", "users"),
+    ("strava_activities_user_id_fkey", "strava_activities", "user_id", "users"),
+    ("strava_sync_status_user_id_fkey", "strava_sync_status", "user_id", "users"),
+    ("user_performance_profiles_user_id_fkey", "user_hiking_profiles", "user_id", "users"),
+    ("user_run_profiles_user_id_fkey", "user_run_profiles", "user_id", "users"),
+    ("notifications_user_id_fkey", "notifications", "user_id", "users"),
+    ("profile_snapshots_user_id_fkey", "profile_snapshots", "user_id", "users"),
+    ("user_race_results_user_id_fkey", "user_race_results", "user_id", "users"),
+]
+
+PRIMARY_KEYS = [
+    ("users", "id"),
+    ("gpx_files", "id"),
+    ("predictions", "id"),
+]
+
+
+def _columns():
+    return PRIMARY_KEYS + [(table, column) for _, table, column, _ in FOREIGN_KEYS]
+
+
+def _drop_foreign_keys() -> None:
+    for name, table, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+
+
+def _create_foreign_keys() -> None:
+    for name, table, column, referred in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referred, [column], ["id"])
+
+
+def upgrade() -> None:
+    _drop_foreign_keys()
+    for table, column in _columns():
+        op.alter_column(
+            table, column,
+            type_=sa.Uuid(),
+            existing_type=sa.String(length=36),
+            postgresql_using=f"{column}::uuid",
+        )
+    _create_foreign_keys()
+
+
+def downgrade() -> None:
+    _drop_foreign_keys()
+    for table, column in _columns():
+        op.alter_column(
+            table, column,
+            type_=sa.String(length=36),
+            existing_type=sa.Uuid(),
+            postgresql_using=f"{column}::text",
+        )
+    _create_foreign_keys()
@@ -64,9 +64,9 @@ async def get_gpx(
 ):
     """Get GPX file information by ID."""
     repo = GPXRepository(db)
-    gpx_file = await repo.get_by_id(gpx_id)
+    gpx_info = await repo.get_info(gpx_id)
 
-    if not gpx_file:
+    if not gpx_info:
         raise HTTPException(status_code=404, detail="GPX file not found")
 
-    return repo.to_info(gpx_file)
+    return gpx_info
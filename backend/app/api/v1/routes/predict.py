@@ -18,6 +18,7 @@ from app.schemas.prediction import (
     GroupPrediction,
     RouteComparisonResponse,
     MacroSegmentSchema,
+    MethodResultSchema,
     ExperienceLevel,
     BackpackWeight,
     TrailRunCompareRequest,
@@ -40,6 +41,13 @@ from app.features.trail_run import TrailRunProfileRepository
 
 router = APIRouter()
 
+# API GAP mode enum -> calculator GAPMode
+_GAP_MODES = {
+    GAPModeEnum.STRAVA: GAPMode.STRAVA,
+    GAPModeEnum.MINETTI: GAPMode.MINETTI,
+    GAPModeEnum.STRAVA_MINETTI: GAPMode.STRAVA_MINETTI,
+}
+
 
 class CompareRequest(BaseModel):
     """Request for method comparison."""
@@ -128,7 +136,7 @@ async def compare_methods(
     """
     # Get GPX file
     gpx_repo = GPXRepository(db)
-    gpx_file = await gpx_repo.get_by_id(request.gpx_id)
+    gpx_file = await gpx_repo.get_by_id(request.gpx_id, with_content=True)
 
     if not gpx_file:
         raise HTTPException(status_code=404, detail=f"GPX file not found: {request.gpx_id}")
@@ -148,7 +156,7 @@ async def compare_methods(
 
     # Extract points
     try:
-        points = GPXParserService.extract_points(gpx_file.gpx_content)
+        points = GPXParserService.extract_points(gpx_file.content)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to parse GPX: {e}")
 
@@ -179,14 +187,14 @@ async def compare_methods(
     for seg in comparison.segments:
         methods_dict = {}
         for method_name, result in seg.methods.items():
-            methods_dict[method_name] = {
-                "method_name": result.method_name,
-                "speed_kmh": result.speed_kmh,
-                "time_hours": result.time_hours,
-                "formula_used": result.formula_used
-            }
-
-        segments.append(MacroSegmentSchema(
+            methods_dict[method_name] = MethodResultSchema.from_trusted(
+                method_name=result.method_name,
+                speed_kmh=result.speed_kmh,
+                time_hours=result.time_hours,
+                formula_used=result.formula_used
+            )
+
+        segments.append(MacroSegmentSchema.from_trusted(
             segment_number=seg.segment_number,
             segment_type=seg.segment_type,
             distance_km=seg.distance_km,
@@ -211,7 +219,7 @@ async def compare_methods(
     rest_time = estimate_rest_time(tobler_hours, request.experience)
     lunch_time = 0.5 if tobler_hours > 4 else 0.0
 
-    return RouteComparisonResponse(
+    return RouteComparisonResponse.from_trusted(
         total_distance_km=comparison.total_distance_km,
         total_ascent_m=comparison.total_ascent_m,
         total_descent_m=comparison.total_descent_m,
@@ -253,7 +261,7 @@ async def compare_trail_run_methods(
     """
     # Get GPX file
     gpx_repo = GPXRepository(db)
-    gpx_file = await gpx_repo.get_by_id(request.gpx_id)
+    gpx_file = await gpx_repo.get_by_id(request.gpx_id, with_content=True)
 
     if not gpx_file:
         raise HTTPException(status_code=404, detail=f"GPX file not found: {request.gpx_id}")
@@ -277,7 +285,7 @@ async def compare_trail_run_methods(
 
     # Extract points
     try:
-        points = GPXParserService.extract_points(gpx_file.gpx_content)
+        points = GPXParserService.extract_points(gpx_file.content)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to parse GPX: {e}")
 
@@ -297,13 +305,7 @@ async def compare_trail_run_methods(
         logger.info(f"Trail run predict - run_profile.avg_flat_pace_min_km: {run_profile.avg_flat_pace_min_km}")
     logger.info(f"Trail run predict - strava_pace: {strava_pace}, manual_pace: {manual_pace}")
 
-    # Map GAP mode enum
-    gap_mode_map = {
-        GAPModeEnum.STRAVA: GAPMode.STRAVA,
-        GAPModeEnum.MINETTI: GAPMode.MINETTI,
-        GAPModeEnum.STRAVA_MINETTI: GAPMode.STRAVA_MINETTI,
-    }
-    gap_mode = gap_mode_map.get(request.gap_mode, GAPMode.STRAVA)
+    gap_mode = _GAP_MODES.get(request.gap_mode, GAPMode.STRAVA)
 
     # Common service params
     service_params = dict(
@@ -331,14 +333,14 @@ async def compare_trail_run_methods(
     # Convert segments to response schema
     segments = []
     for seg_result in result.segments:
-        segments.append(TrailRunSegmentSchema(
+        segments.append(TrailRunSegmentSchema.from_trusted(
             segment_number=seg_result.segment.segment_number,
             start_km=0,  # Not tracked in MacroSegment
             end_km=0,
             distance_km=round(seg_result.segment.distance_km, 2),
             elevation_change_m=round(seg_result.segment.elevation_change_m, 0),
             gradient_percent=round(seg_result.segment.gradient_percent, 1),
-            movement=SegmentMovementInfo(
+            movement=SegmentMovementInfo.from_trusted(
                 mode=seg_result.movement.mode.value,
                 reason=seg_result.movement.reason,
                 threshold_used=seg_result.movement.threshold_used,
@@ -349,7 +351,7 @@ async def compare_trail_run_methods(
         ))
 
     # Build summary
-    summary = TrailRunSummarySchema(
+    summary = TrailRunSummarySchema.from_trusted(
         total_distance_km=result.summary.total_distance_km,
         total_elevation_gain_m=result.summary.total_elevation_gain_m,
         total_elevation_loss_m=result.summary.total_elevation_loss_m,
@@ -364,7 +366,7 @@ async def compare_trail_run_methods(
     # Format as text for bot
     formatted = _format_trail_run_result(result, manual_pace)
 
-    return TrailRunCompareResponse(
+    return TrailRunCompareResponse.from_trusted(
         activity_type="trail_run",
         segments=segments,
         totals=totals_manual,  # Primary results (manual pace)
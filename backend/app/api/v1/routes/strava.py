@@ -520,7 +520,7 @@ async def get_strava_activities(
                 name=a.name,
                 activity_type=a.activity_type,
                 start_date=a.start_date,
-                distance_km=round(a.distance_m / 1000, 2) if a.distance_m else 0,
+                distance_km=a.distance_km,
                 moving_time_min=round(a.moving_time_s / 60) if a.moving_time_s else 0,
                 elevation_gain_m=round(a.elevation_gain_m or 0, 0),
                 pace_min_km=a.pace_min_per_km,
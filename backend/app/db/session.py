@@ -16,11 +16,25 @@ from app.config import settings
 # Synchronous Engine (for existing code)
 # =============================================================================
 
-engine = create_engine(settings.database_url)
+engine = create_engine(
+    settings.database_url,
+    pool_size=5,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_recycle=1800,  # 30 minutes
+    pool_pre_ping=True,
+)
 
 
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects stay readable after commit without
+# a re-SELECT per attribute (matches AsyncSessionLocal below).
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -51,6 +65,7 @@ async_engine = create_async_engine(
     max_overflow=10,
     pool_timeout=30,
     pool_recycle=1800,  # 30 minutes
+    pool_pre_ping=True,
 )
 
 # Async session factory
@@ -4,12 +4,15 @@ GPX file model.
 Stores uploaded GPX files and their metadata.
 """
 
-from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Float, Integer, ForeignKey, Text, LargeBinary
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 import uuid
+import zlib
 
-from app.models.base import Base
+from app.models.base import Base, UUIDString, utc_now
+
+# content_encoding values; NULL means raw bytes (rows written before compression)
+CONTENT_ENCODING_ZLIB = "zlib"
 
 
 class GPXFile(Base):
@@ -22,13 +25,18 @@ class GPXFile(Base):
 
     __tablename__ = "gpx_files"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
 
     # File info
     filename = Column(String(255), nullable=False)
     file_path = Column(String(500), nullable=True)  # Local storage path (not used)
-    file_size = Column(Integer, nullable=True)
-    gpx_content = Column(LargeBinary, nullable=True)  # Raw GPX file content
+    file_size = Column(Integer, nullable=True)  # Original (uncompressed) size
+    # Stored GPX file content, encoded per content_encoding; read it through
+    # `content`. Deferred: metadata reads skip the blob;
+    # use GPXRepository.get_by_id(..., with_content=True) to load it.
+    gpx_content = deferred(Column(LargeBinary, nullable=True))
+    content_encoding = Column(String(8), nullable=True)
+    stored_size = Column(Integer, nullable=True)  # Bytes actually stored
 
     # Route metadata (extracted from GPX)
     name = Column(String(255), nullable=True)
@@ -48,13 +56,22 @@ class GPXFile(Base):
     end_lon = Column(Float, nullable=True)
 
     # Owner
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=True)
+    user_id = Column(UUIDString, ForeignKey("users.id"), nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     # Relationships
     predictions = relationship("Prediction", back_populates="gpx_file")
 
+    @property
+    def content(self) -> bytes | None:
+        """Raw GPX bytes, decoded from gpx_content."""
+        if self.gpx_content is None:
+            return None
+        if self.content_encoding == CONTENT_ENCODING_ZLIB:
+            return zlib.decompress(self.gpx_content)
+        return self.gpx_content
+
     def __repr__(self):
         return f"<GPXFile {self.id} ({self.filename})>"
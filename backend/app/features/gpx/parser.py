@@ -11,14 +11,14 @@ from typing import List, Tuple
 import gpxpy
 import gpxpy.gpx
 
-from app.shared.geo import haversine, calculate_total_distance
+from app.shared.geo import haversine, calculate_total_distance, step_distances
 from app.shared.elevation import calculate_elevation_changes
 from .schemas import GPXInfo
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class GPXSegment:
     """A segment of a GPX route for UI display."""
 
@@ -55,22 +55,7 @@ class GPXParserService:
             logger.error(f"Failed to parse GPX: {e}")
             raise ValueError(f"Invalid GPX file: {e}")
 
-        # Collect all points from tracks and routes
-        points: List[Tuple[float, float, float]] = []
-
-        # From tracks
-        for track in gpx.tracks:
-            for segment in track.segments:
-                for point in segment.points:
-                    ele = point.elevation if point.elevation else 0
-                    points.append((point.latitude, point.longitude, ele))
-
-        # From routes (if no tracks)
-        if not points:
-            for route in gpx.routes:
-                for point in route.points:
-                    ele = point.elevation if point.elevation else 0
-                    points.append((point.latitude, point.longitude, ele))
+        points = GPXParserService._collect_points(gpx)
 
         if not points:
             raise ValueError("GPX file contains no track or route points")
@@ -116,19 +101,24 @@ class GPXParserService:
             List of (lat, lon, elevation) tuples
         """
         gpx = gpxpy.parse(content.decode('utf-8'))
-        points: List[Tuple[float, float, float]] = []
+        return GPXParserService._collect_points(gpx)
 
-        for track in gpx.tracks:
-            for segment in track.segments:
-                for point in segment.points:
-                    ele = point.elevation if point.elevation else 0
-                    points.append((point.latitude, point.longitude, ele))
+    @staticmethod
+    def _collect_points(gpx: gpxpy.gpx.GPX) -> List[Tuple[float, float, float]]:
+        """Collect (lat, lon, elevation) from all tracks, or from routes if there are no track points."""
+        points = [
+            (point.latitude, point.longitude, 0 if point.elevation is None else point.elevation)
+            for track in gpx.tracks
+            for segment in track.segments
+            for point in segment.points
+        ]
 
         if not points:
-            for route in gpx.routes:
-                for point in route.points:
-                    ele = point.elevation if point.elevation else 0
-                    points.append((point.latitude, point.longitude, ele))
+            points = [
+                (point.latitude, point.longitude, 0 if point.elevation is None else point.elevation)
+                for route in gpx.routes
+                for point in route.points
+            ]
 
         return points
 
@@ -163,11 +153,13 @@ class GPXParserService:
         cumulative_km = 0.0
         current_gradient = None
 
+        steps = step_distances(points)
+
         for i in range(1, len(points)):
-            lat1, lon1, ele1 = points[i - 1]
-            lat2, lon2, ele2 = points[i]
+            ele1 = points[i - 1][2]
+            ele2 = points[i][2]
 
-            step_distance = haversine(lat1, lon1, lat2, lon2)
+            step_distance = steps[i - 1]
             cumulative_km += step_distance
 
             segment_distance = cumulative_km - segment_start_km
@@ -222,14 +214,7 @@ class GPXParserService:
         distance_km = end_km - start_km
 
         # Calculate elevation changes
-        gain = 0.0
-        loss = 0.0
-        for j in range(1, len(segment_points)):
-            diff = segment_points[j][2] - segment_points[j - 1][2]
-            if diff > 0:
-                gain += diff
-            else:
-                loss += abs(diff)
+        gain, loss = calculate_elevation_changes([p[2] for p in segment_points])
 
         start_ele = segment_points[0][2]
         end_ele = segment_points[-1][2]
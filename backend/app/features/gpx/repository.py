@@ -4,13 +4,22 @@ GPX Repository.
 Data access layer for GPX files.
 """
 
+import uuid
+import zlib
+from collections import OrderedDict
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
-from .models import GPXFile
+from .models import GPXFile, CONTENT_ENCODING_ZLIB
 from .schemas import GPXInfo
 
+# GPX rows are never updated after upload, so their GPXInfo can be
+# cached process-wide. gpx_id -> GPXInfo, least recently used first.
+_INFO_CACHE_SIZE = 128
+_info_cache: OrderedDict[str, GPXInfo] = OrderedDict()
+
 
 class GPXRepository:
     """Repository for GPX file operations."""
@@ -35,10 +44,50 @@ class GPXRepository:
         Returns:
             Created GPXFile model
         """
-        gpx_file = GPXFile(
+        gpx_file = self._build(filename, content, info)
+
+        self.db.add(gpx_file)
+        await self.db.commit()
+        # No refresh(): created_at comes back via eager_defaults and the
+        # async session does not expire attributes on commit.
+
+        return gpx_file
+
+    async def bulk_create(
+        self,
+        items: list[tuple[str, bytes, GPXInfo]]
+    ) -> list[GPXFile]:
+        """
+        Create several GPX file records in one transaction.
+
+        Args:
+            items: (filename, raw content, parsed metadata) per file
+
+        Returns:
+            Created GPXFile models, in input order
+        """
+        gpx_files = [
+            self._build(filename, content, info)
+            for filename, content, info in items
+        ]
+
+        self.db.add_all(gpx_files)
+        await self.db.commit()
+
+        return gpx_files
+
+    @staticmethod
+    def _build(filename: str, content: bytes, info: GPXInfo) -> GPXFile:
+        """Build an unsaved GPXFile with compressed content."""
+        # GPX XML compresses ~5x; level 6 is zlib's default speed/size balance
+        stored = zlib.compress(content, 6)
+
+        return GPXFile(
             filename=filename,
             file_size=len(content),
-            gpx_content=content,
+            gpx_content=stored,
+            content_encoding=CONTENT_ENCODING_ZLIB,
+            stored_size=len(stored),
             name=info.name,
             description=info.description,
             distance_km=info.distance_km,
@@ -52,26 +101,69 @@ class GPXRepository:
             end_lon=info.end_lon,
         )
 
-        self.db.add(gpx_file)
-        await self.db.commit()
-        await self.db.refresh(gpx_file)
+    async def get_by_id(
+        self,
+        gpx_id: str,
+        with_content: bool = False
+    ) -> Optional[GPXFile]:
+        """
+        Get GPX file by ID.
+
+        Args:
+            gpx_id: UUID of the GPX file
+            with_content: Also load the gpx_content blob (decoded via
+                GPXFile.content). Without it only metadata is fetched;
+                gpx_content is deferred and cannot be lazy-loaded on an
+                async session.
+
+        Returns:
+            GPXFile if found, None otherwise
+        """
+        # ids are native uuid columns: a malformed id would fail the
+        # query with a DataError instead of simply not matching
+        try:
+            uuid.UUID(gpx_id)
+        except ValueError:
+            return None
+
+        # session.get() checks the identity map before issuing a SELECT
+        options = [undefer(GPXFile.gpx_content)] if with_content else None
+        gpx_file = await self.db.get(GPXFile, gpx_id, options=options)
+
+        # Already in the identity map without the blob: load just that column
+        if (
+            gpx_file is not None
+            and with_content
+            and "gpx_content" in inspect(gpx_file).unloaded
+        ):
+            await self.db.refresh(gpx_file, ["gpx_content"])
 
         return gpx_file
 
-    async def get_by_id(self, gpx_id: str) -> Optional[GPXFile]:
+    async def get_info(self, gpx_id: str) -> Optional[GPXInfo]:
         """
-        Get GPX file by ID.
+        Get GPX metadata by ID, served from a process-wide LRU cache.
 
         Args:
             gpx_id: UUID of the GPX file
 
         Returns:
-            GPXFile if found, None otherwise
+            GPXInfo if found, None otherwise
         """
-        result = await self.db.execute(
-            select(GPXFile).where(GPXFile.id == gpx_id)
-        )
-        return result.scalar_one_or_none()
+        info = _info_cache.get(gpx_id)
+        if info is not None:
+            _info_cache.move_to_end(gpx_id)
+            return info
+
+        gpx_file = await self.get_by_id(gpx_id)
+        if gpx_file is None:
+            return None
+
+        info = self.to_info(gpx_file)
+        _info_cache[gpx_id] = info
+        if len(_info_cache) > _INFO_CACHE_SIZE:
+            _info_cache.popitem(last=False)
+        return info
 
     def to_info(self, gpx_file: GPXFile) -> GPXInfo:
         """
@@ -10,13 +10,13 @@ from typing import List, Tuple
 
 # Import from shared to avoid circular import
 from app.shared.calculator_types import MacroSegment, SegmentType
-from app.shared.geo import haversine
-from app.shared.elevation import smooth_elevations
+from app.shared.geo import cumulative_distances
+from app.shared.elevation import smooth_elevations, calculate_elevation_changes
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
-    """A point on the route."""
+    """A point on the route (kept for API compatibility; the segmenter works on columns)."""
     lat: float
     lon: float
     elevation: float
@@ -69,81 +69,43 @@ class RouteSegmenter:
         if len(points) < 2:
             return []
 
-        # Convert to Point objects with cumulative distance
-        route_points = cls._prepare_points(points)
+        # Parallel columns: cumulative distance and elevation per point
+        cumulative = cumulative_distances(points)
+        elevations = [ele for _, _, ele in points]
 
         # Smooth elevations to reduce noise
-        route_points = cls._smooth_elevations(route_points)
+        if len(elevations) > cls.SMOOTHING_WINDOW:
+            elevations = smooth_elevations(elevations, cls.SMOOTHING_WINDOW)
 
         # Find direction change points
-        segments = cls._find_segments(route_points)
-
-        return segments
+        return cls._find_segments(cumulative, elevations)
 
     @classmethod
-    def _prepare_points(
+    def _find_segments(
         cls,
-        points: List[Tuple[float, float, float]]
-    ) -> List[Point]:
-        """Convert raw points to Point objects with cumulative distance."""
-        result = []
-        cumulative = 0.0
-
-        for i, (lat, lon, ele) in enumerate(points):
-            if i > 0:
-                prev_lat, prev_lon, _ = points[i - 1]
-                cumulative += haversine(prev_lat, prev_lon, lat, lon)
-
-            result.append(Point(
-                lat=lat,
-                lon=lon,
-                elevation=ele,
-                cumulative_distance_km=cumulative
-            ))
-
-        return result
-
-    @classmethod
-    def _smooth_elevations(cls, points: List[Point]) -> List[Point]:
-        """Apply moving average smoothing to elevations using shared utility."""
-        if len(points) <= cls.SMOOTHING_WINDOW:
-            return points
-
-        # Extract elevations and smooth them
-        elevations = [p.elevation for p in points]
-        smoothed_elevations = smooth_elevations(elevations, cls.SMOOTHING_WINDOW)
-
-        # Create new Point objects with smoothed elevations
-        return [
-            Point(
-                lat=p.lat,
-                lon=p.lon,
-                elevation=smoothed_ele,
-                cumulative_distance_km=p.cumulative_distance_km
-            )
-            for p, smoothed_ele in zip(points, smoothed_elevations)
-        ]
-
-    @classmethod
-    def _find_segments(cls, points: List[Point]) -> List[MacroSegment]:
+        cumulative: List[float],
+        elevations: List[float]
+    ) -> List[MacroSegment]:
         """Find segments by detecting direction changes."""
         segments = []
         segment_start = 0
         current_direction = None  # 'up', 'down', or 'flat'
+        flat_threshold = cls.FLAT_THRESHOLD_PERCENT
+        n = len(cumulative)
 
-        for i in range(1, len(points)):
+        for i in range(1, n):
             # Calculate gradient for this step
-            dist = points[i].cumulative_distance_km - points[i-1].cumulative_distance_km
+            dist = cumulative[i] - cumulative[i-1]
             if dist < 0.001:  # Avoid division by zero
                 continue
 
-            ele_change = points[i].elevation - points[i-1].elevation
+            ele_change = elevations[i] - elevations[i-1]
             gradient = (ele_change / (dist * 1000)) * 100  # As percentage
 
             # Determine direction
-            if gradient > cls.FLAT_THRESHOLD_PERCENT:
+            if gradient > flat_threshold:
                 direction = 'up'
-            elif gradient < -cls.FLAT_THRESHOLD_PERCENT:
+            elif gradient < -flat_threshold:
                 direction = 'down'
             else:
                 direction = 'flat'
@@ -153,14 +115,11 @@ class RouteSegmenter:
                 current_direction = direction
             elif direction != current_direction and direction != 'flat':
                 # Direction changed - finalize segment if long enough
-                segment_dist = (
-                    points[i-1].cumulative_distance_km -
-                    points[segment_start].cumulative_distance_km
-                )
+                segment_dist = cumulative[i-1] - cumulative[segment_start]
 
                 if segment_dist >= cls.MIN_SEGMENT_KM:
                     segment = cls._create_segment(
-                        points[segment_start:i],
+                        cumulative, elevations, segment_start, i,
                         len(segments) + 1,
                         current_direction
                     )
@@ -170,9 +129,9 @@ class RouteSegmenter:
                 current_direction = direction
 
         # Add final segment
-        if segment_start < len(points) - 1:
+        if segment_start < n - 1:
             segment = cls._create_segment(
-                points[segment_start:],
+                cumulative, elevations, segment_start, n,
                 len(segments) + 1,
                 current_direction or 'flat'
             )
@@ -183,40 +142,40 @@ class RouteSegmenter:
     @classmethod
     def _create_segment(
         cls,
-        points: List[Point],
+        cumulative: List[float],
+        elevations: List[float],
+        start: int,
+        end: int,
         number: int,
         direction: str
     ) -> MacroSegment:
-        """Create a MacroSegment from a list of points."""
-        if len(points) < 2:
+        """Create a MacroSegment from the points in [start, end)."""
+        start_elevation = elevations[start]
+
+        if end - start < 2:
             # Edge case: single point
-            p = points[0]
             return MacroSegment(
                 segment_number=number,
                 segment_type=SegmentType.FLAT,
                 distance_km=0.0,
                 elevation_gain_m=0.0,
                 elevation_loss_m=0.0,
-                start_elevation_m=p.elevation,
-                end_elevation_m=p.elevation
+                start_elevation_m=start_elevation,
+                end_elevation_m=start_elevation
             )
 
+        last = end - 1
+        end_elevation = elevations[last]
+
         # Calculate distance
-        distance = points[-1].cumulative_distance_km - points[0].cumulative_distance_km
+        distance = cumulative[last] - cumulative[start]
 
         # Calculate elevation gain/loss
-        gain = 0.0
-        loss = 0.0
-        for i in range(1, len(points)):
-            diff = points[i].elevation - points[i-1].elevation
-            if diff > 0:
-                gain += diff
-            else:
-                loss += abs(diff)
+        gain, loss = calculate_elevation_changes(elevations[start:end])
 
         # Determine segment type based on ACTUAL elevation change, not passed direction
         # This fixes bug where direction didn't match actual gradient
-        elevation_change = points[-1].elevation - points[0].elevation
+        elevation_change = end_elevation - start_elevation
         if distance > 0:
             actual_gradient = (elevation_change / (distance * 1000)) * 100
         else:
@@ -235,6 +194,6 @@ class RouteSegmenter:
             distance_km=round(distance, 2),
             elevation_gain_m=round(gain, 0),
             elevation_loss_m=round(loss, 0),
-            start_elevation_m=round(points[0].elevation, 0),
-            end_elevation_m=round(points[-1].elevation, 0)
+            start_elevation_m=round(start_elevation, 0),
+            end_elevation_m=round(end_elevation, 0)
         )
@@ -15,7 +15,7 @@ Available components:
 - HikePersonalizationService: Personalization based on Strava
 """
 from .models import UserHikingProfile
-from .schemas import HikePredictRequest, HikePrediction, MethodComparison
+from app.schemas.prediction import HikePredictRequest, HikePrediction
 from .repository import HikingProfileRepository
 
 # Backward compatibility
@@ -26,7 +26,6 @@ __all__ = [
     "UserPerformanceProfile",  # deprecated alias
     "HikePredictRequest",
     "HikePrediction",
-    "MethodComparison",
     # Repository
     "HikingProfileRepository",
 ]
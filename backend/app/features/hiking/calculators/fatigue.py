@@ -11,7 +11,8 @@ Based on:
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Sequence, Tuple
 
 
 # Fatigue model parameters
@@ -24,6 +25,9 @@ LINEAR_DEGRADATION_PER_HOUR = 0.03  # 3%
 # Quadratic component: additional slowdown that accelerates over time
 QUADRATIC_DEGRADATION = 0.005
 
+# Elapsed times (hours) shown in get_fatigue_info
+_EXAMPLE_HOURS = (3, 4, 5, 6, 7, 8, 10, 12)
+
 
 @dataclass
 class FatigueConfig:
@@ -102,6 +106,35 @@ class HikeFatigueService:
 
         return multiplier
 
+    def calculate_multipliers(self, elapsed_hours: Sequence[float]) -> List[float]:
+        """
+        Calculate fatigue multipliers for several elapsed times at once.
+
+        Same values as calculate_multiplier() per element, with the config
+        read once instead of per call.
+
+        Args:
+            elapsed_hours: Times elapsed since start of hike
+
+        Returns:
+            Multiplier for each elapsed time, in order
+        """
+        if not self.config.enabled:
+            return [1.0] * len(elapsed_hours)
+
+        threshold = self.config.threshold_hours
+        linear_rate = self.config.linear_rate
+        quadratic_rate = self.config.quadratic_rate
+
+        multipliers = []
+        for elapsed in elapsed_hours:
+            extra = elapsed - threshold
+            if extra > 0:
+                multipliers.append(1.0 + (linear_rate * extra) + (quadratic_rate * extra ** 2))
+            else:
+                multipliers.append(1.0)
+        return multipliers
+
     def apply_to_segment(
         self,
         segment_time_hours: float,
@@ -153,15 +186,23 @@ class HikeFatigueService:
         if not self.config.enabled:
             return segment_times, [1.0] * len(segment_times), sum(segment_times)
 
+        # apply_to_segment/calculate_multiplier inlined with the config
+        # bound to locals: one pass, no per-segment method calls.
+        threshold = self.config.threshold_hours
+        linear_rate = self.config.linear_rate
+        quadratic_rate = self.config.quadratic_rate
+
         adjusted_times = []
         multipliers = []
         cumulative_time = 0.0
 
         for base_time in segment_times:
-            adjusted_time, multiplier = self.apply_to_segment(
-                base_time,
-                cumulative_time
-            )
+            extra = cumulative_time + (base_time / 2) - threshold
+            if extra > 0:
+                multiplier = 1.0 + (linear_rate * extra) + (quadratic_rate * extra ** 2)
+            else:
+                multiplier = 1.0
+            adjusted_time = base_time * multiplier
             adjusted_times.append(adjusted_time)
             multipliers.append(multiplier)
             cumulative_time += adjusted_time
@@ -230,10 +271,10 @@ class HikeFatigueService:
             return {"enabled": False}
 
         # Calculate example multipliers
-        examples = {}
-        for hours in [3, 4, 5, 6, 7, 8, 10, 12]:
-            mult = self.calculate_multiplier(hours)
-            examples[f"{hours}h"] = round(mult, 3)
+        config = self.config
+        examples = dict(_example_multipliers(
+            config.threshold_hours, config.linear_rate, config.quadratic_rate
+        ))
 
         return {
             "enabled": True,
@@ -244,5 +285,19 @@ class HikeFatigueService:
         }
 
 
+@lru_cache(maxsize=16)
+def _example_multipliers(
+    threshold_hours: float,
+    linear_rate: float,
+    quadratic_rate: float
+) -> Tuple[Tuple[str, float], ...]:
+    """get_fatigue_info example table, computed once per model parameters."""
+    service = HikeFatigueService.create_enabled(threshold_hours, linear_rate, quadratic_rate)
+    return tuple(
+        (f"{hours}h", round(mult, 3))
+        for hours, mult in zip(_EXAMPLE_HOURS, service.calculate_multipliers(_EXAMPLE_HOURS))
+    )
+
+
 # Backward compatibility alias
 FatigueService = HikeFatigueService
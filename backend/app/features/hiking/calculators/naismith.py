@@ -105,6 +105,23 @@ class NaismithCalculator(PaceCalculator):
             formula_used=formula
         )
 
+    def segment_hours(
+        self,
+        segment: MacroSegment,
+        profile_multiplier: float = 1.0
+    ) -> float:
+        """Time in hours; calculate_segment's arithmetic without the formula."""
+        total_hours = segment.distance_km / self.BASE_SPEED_KMH
+
+        if segment.segment_type == SegmentType.ASCENT:
+            total_hours += segment.elevation_gain_m / self.CLIMB_RATE_M_PER_HOUR
+        elif segment.segment_type == SegmentType.DESCENT:
+            total_hours += self._langmuir_correction(
+                segment.elevation_loss_m, abs(segment.gradient_degrees)
+            )
+
+        return round(total_hours * profile_multiplier, 3)
+
     def _langmuir_correction(self, descent_m: float, gradient_deg: float) -> float:
         """
         Calculate Langmuir descent time correction.
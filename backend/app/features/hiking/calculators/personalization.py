@@ -66,6 +66,15 @@ class HikePersonalizationService(BasePersonalizationService):
         self.use_11_categories = bool(
             profile and getattr(profile, 'gradient_paces', None)
         )
+        # Legacy (uphill, downhill, flat) paces with fallbacks resolved once;
+        # the profile is not modified while a service is in use.
+        self._legacy_paces = None
+        if profile is not None:
+            self._legacy_paces = (
+                profile.avg_uphill_pace_min_km or self._estimate_uphill_pace(),
+                profile.avg_downhill_pace_min_km or self._estimate_downhill_pace(),
+                profile.avg_flat_pace_min_km or (60 / DEFAULT_FLAT_SPEED_KMH),
+            )
 
     def _get_pace_legacy(self, gradient_percent: float) -> float:
         """
@@ -77,15 +86,13 @@ class HikePersonalizationService(BasePersonalizationService):
         Returns:
             Pace in minutes per kilometer
         """
+        uphill_pace, downhill_pace, flat_pace = self._legacy_paces
         if gradient_percent > FLAT_GRADIENT_MAX:
-            # Uphill
-            return self.profile.avg_uphill_pace_min_km or self._estimate_uphill_pace()
+            return uphill_pace
         elif gradient_percent < FLAT_GRADIENT_MIN:
-            # Downhill
-            return self.profile.avg_downhill_pace_min_km or self._estimate_downhill_pace()
+            return downhill_pace
         else:
-            # Flat
-            return self.profile.avg_flat_pace_min_km or (60 / DEFAULT_FLAT_SPEED_KMH)
+            return flat_pace
 
     def _get_pace_for_category(self, category: str) -> Optional[float]:
         """
@@ -11,9 +11,10 @@ and 7-category (extended) gradient classification systems.
 
 import math
 from abc import ABC, abstractmethod
+from functools import partial
 from typing import List, Optional
 
-from app.shared.calculator_types import MacroSegment, MethodResult
+from app.shared.calculator_types import MacroSegment, MethodResult, MethodResultBatch
 from app.shared.gradients import (
     LEGACY_GRADIENT_THRESHOLDS as GRADIENT_THRESHOLDS,
     FLAT_GRADIENT_MIN,
@@ -53,6 +54,9 @@ class BasePersonalizationService(ABC):
                                    If False, use legacy 3-category system.
         """
         self.use_extended_gradients = use_extended_gradients
+        # Profile pace per gradient category, resolved on first use. The
+        # profile is not modified while a service is in use.
+        self._category_paces: dict[str, Optional[float]] = {}
 
     def calculate_segment(
         self,
@@ -93,11 +97,36 @@ class BasePersonalizationService(ABC):
             formula_used=formula
         )
 
+    def segment_hours(self, segment: MacroSegment) -> float:
+        """
+        Personalized time in hours for a single segment.
+
+        Same value as calculate_segment(...).time_hours, without building
+        the MethodResult and its formula string.
+        """
+        pace_min_km = self._get_pace_for_gradient(segment.gradient_percent)
+        speed_kmh = 60 / pace_min_km if pace_min_km > 0 else self._get_default_speed()
+        time_hours = segment.distance_km / speed_kmh if speed_kmh > 0 else 0.0
+        return round(time_hours, 4)
+
+    def calculate_route_hours(self, segments: List[MacroSegment]) -> List[float]:
+        """
+        Per-segment personalized times in hours, for callers that only need totals.
+
+        Args:
+            segments: List of MacroSegment objects
+
+        Returns:
+            Time in hours for each segment, in order
+        """
+        segment_hours = self.segment_hours
+        return [segment_hours(segment) for segment in segments]
+
     def calculate_route(
         self,
         segments: List[MacroSegment],
         base_method: str = "personalized"
-    ) -> tuple[float, List[MethodResult]]:
+    ) -> tuple[float, MethodResultBatch]:
         """
         Calculate total personalized time for a route.
 
@@ -106,17 +135,13 @@ class BasePersonalizationService(ABC):
             base_method: Base method name for result naming
 
         Returns:
-            Tuple of (total_hours, list of segment results)
+            Tuple of (total_hours, segment results). The results are a
+            lazy sequence of MethodResult, built on access.
         """
-        results = []
-        total_hours = 0.0
-
-        for segment in segments:
-            result = self.calculate_segment(segment, base_method)
-            results.append(result)
-            total_hours += result.time_hours
-
-        return total_hours, results
+        times_hours = self.calculate_route_hours(segments)
+        build = partial(self.calculate_segment, base_method=base_method)
+        batch = MethodResultBatch(build, segments, times_hours)
+        return sum(times_hours), batch
 
     def _get_pace_for_gradient(self, gradient_percent: float) -> float:
         """
@@ -149,7 +174,10 @@ class BasePersonalizationService(ABC):
             Pace in minutes per kilometer
         """
         category = self._classify_gradient_extended(gradient_percent)
-        pace = self._get_pace_for_category(category)
+        try:
+            pace = self._category_paces[category]
+        except KeyError:
+            pace = self._category_paces[category] = self._get_pace_for_category(category)
 
         if pace is not None:
             return pace
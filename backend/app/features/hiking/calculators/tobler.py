@@ -78,6 +78,16 @@ class ToblerCalculator(PaceCalculator):
             formula_used=formula
         )
 
+    def segment_hours(
+        self,
+        segment: MacroSegment,
+        profile_multiplier: float = 1.0
+    ) -> float:
+        """Time in hours; calculate_segment's arithmetic without the formula."""
+        speed_kmh = tobler_hiking_speed(segment.gradient_percent / 100)
+        base_hours = segment.distance_km / speed_kmh if speed_kmh > 0 else float('inf')
+        return round(base_hours * profile_multiplier, 3)
+
     def _tobler_speed(self, gradient: float) -> float:
         """
         Calculate walking speed using Tobler's function.
@@ -5,7 +5,7 @@ For predictions, use app.services.prediction.PredictionService
 which orchestrates both hiking and trail_run calculations.
 """
 
-# Re-export schemas for convenience
-from .schemas import HikePredictRequest, HikePrediction
+# Re-export schemas for convenience (defined once, in app.schemas.prediction)
+from app.schemas.prediction import HikePredictRequest, HikePrediction
 
 __all__ = ["HikePredictRequest", "HikePrediction"]
@@ -11,8 +11,6 @@ Tables:
 - user_race_results: Links our users to their race results
 """
 
-from datetime import datetime
-
 from sqlalchemy import (
     Boolean,
     Column,
@@ -27,7 +25,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import relationship
 
-from app.models.base import Base
+from app.models.base import Base, UUIDString, utc_now
 
 
 class Club(Base):
@@ -39,8 +37,8 @@ class Club(Base):
     name = Column(String(255), nullable=False)  # display name: "SRG", "RUNFINITY"
     name_normalized = Column(String(255), nullable=False, unique=True, index=True)  # lowercase
     runners_count = Column(Integer, default=0)  # cached count of unique runners
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     runners = relationship("Runner", back_populates="club_ref")
     aliases = relationship("ClubNameAlias", back_populates="club", cascade="all, delete-orphan")
@@ -64,8 +62,8 @@ class Runner(Base):
     category = Column(String(32), nullable=True)  # latest category
     birth_year = Column(Integer, nullable=True)
     races_count = Column(Integer, default=0)  # cached count of unique race editions
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     __table_args__ = (
         # UNIQUE only when birth_year is known. In Postgres NULL != NULL, so
@@ -96,7 +94,7 @@ class Race(Base):
     name_aliases = Column(JSON, nullable=True)  # ["Alpine Race", "Almaty Alpine Race"]
     type = Column(String(64), nullable=True)  # "trail_sky"
     location = Column(String(255), nullable=True)  # "Шымбулак"
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     editions = relationship("RaceEdition", back_populates="race", cascade="all, delete-orphan")
 
@@ -197,11 +195,11 @@ class UserRaceResult(Base):
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUIDString, ForeignKey("users.id"), nullable=False)
     race_result_id = Column(Integer, ForeignKey("race_results.id"), nullable=False)
     matched_by = Column(String(16), nullable=False)  # "auto" | "manual"
     confirmed = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     user = relationship("User", backref="race_results")
     race_result = relationship("RaceResultDB", back_populates="user_links")
@@ -223,7 +221,7 @@ class RunnerNameAlias(Base):
     name = Column(String(255), nullable=False)  # original spelling
     name_normalized = Column(String(255), nullable=False, index=True)  # lowercase for lookup
     source = Column(String(50), nullable=False)  # "clax", "am", "manual"
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     runner = relationship("Runner", back_populates="aliases")
 
@@ -244,7 +242,7 @@ class ClubNameAlias(Base):
     name = Column(String(255), nullable=False)  # original spelling
     name_normalized = Column(String(255), nullable=False, index=True)  # lowercase for lookup
     source = Column(String(50), nullable=False)  # "clax", "am", "manual"
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     club = relationship("Club", back_populates="aliases")
 
@@ -191,7 +191,7 @@ class RaceService:
     ) -> tuple[int, str, dict[str, int]]:
         """Run hiking prediction (Tobler + Naismith). Returns (seconds, method, all)."""
         comparison = ComparisonService()
-        result = comparison.compare_route(points)
+        result = comparison.compare_route(points, include_segments=False)
 
         all_methods: dict[str, int] = {}
         for key, val in result.totals.items():
@@ -17,6 +17,7 @@ Data Policy:
 
 import asyncio
 import logging
+import time
 from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Optional
@@ -227,7 +228,7 @@ class StravaClient:
             return None
 
         # Check if expired (with 5 min buffer)
-        if token.expires_at < datetime.utcnow().timestamp() + 300:
+        if token.expires_at < time.time() + 300:
             logger.info(f"Refreshing Strava token for user {user_id}")
             new_tokens = await self.refresh_token(token.refresh_token)
 
@@ -8,13 +8,17 @@ Models:
 - StravaSyncStatus: Sync progress tracking
 """
 
-from datetime import datetime
+import time
 from typing import Optional
 
-from sqlalchemy import Column, String, DateTime, Integer, Float, ForeignKey, BigInteger, Text
+from sqlalchemy import (
+    Column, String, DateTime, Integer, Float, ForeignKey, BigInteger, Text, Index,
+    and_, case, func,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
-from app.models.base import Base
+from app.models.base import Base, UUIDString, utc_now
 
 
 class StravaToken(Base):
@@ -26,9 +30,13 @@ class StravaToken(Base):
     """
 
     __tablename__ = "strava_tokens"
+    __table_args__ = (
+        # Bulk refresh: "tokens expiring before T" is a range scan
+        Index("ix_strava_tokens_expires_at", "expires_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(36), ForeignKey("users.id"), unique=True, nullable=False)
+    user_id = Column(UUIDString, ForeignKey("users.id"), unique=True, nullable=False)
 
     # Strava athlete info
     strava_athlete_id = Column(BigInteger, unique=True, nullable=False)
@@ -42,15 +50,21 @@ class StravaToken(Base):
     scope = Column(String(255), nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     # Relationship
     user = relationship("User", backref="strava_token")
 
+    @hybrid_property
     def is_expired(self) -> bool:
         """Check if access token is expired."""
-        return datetime.utcnow().timestamp() >= self.expires_at
+        # expires_at is a Unix timestamp; time.time() is already UTC epoch
+        return time.time() >= self.expires_at
+
+    @is_expired.expression
+    def is_expired(cls):
+        return cls.expires_at <= func.extract("epoch", func.now())
 
     def __repr__(self):
         return f"<StravaToken user_id={self.user_id} athlete_id={self.strava_athlete_id}>"
@@ -66,9 +80,16 @@ class StravaActivity(Base):
     """
 
     __tablename__ = "strava_activities"
+    __table_args__ = (
+        # Hot queries filter by user (and type) and order by start_date DESC.
+        # A B-tree is scanned backwards for DESC, so plain column order is
+        # enough; user_id-only lookups use the leading column.
+        Index("ix_strava_act_user_date", "user_id", "start_date"),
+        Index("ix_strava_act_user_type_date", "user_id", "activity_type", "start_date"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUIDString, ForeignKey("users.id"), nullable=False)
 
     # Strava identifiers
     strava_id = Column(BigInteger, unique=True, nullable=False)  # Strava activity ID
@@ -76,7 +97,7 @@ class StravaActivity(Base):
     # Activity info
     name = Column(String(255), nullable=True)
     activity_type = Column(String(50), nullable=False)  # Run, Hike, Walk, etc.
-    start_date = Column(DateTime, nullable=False, index=True)
+    start_date = Column(DateTime, nullable=False)
 
     # Core metrics (aggregated - safe to store)
     distance_m = Column(Float, nullable=True)
@@ -103,7 +124,7 @@ class StravaActivity(Base):
     splits_synced = Column(Integer, default=0)
 
     # Sync metadata
-    synced_at = Column(DateTime, default=datetime.utcnow)
+    synced_at = Column(DateTime, server_default=utc_now())
 
     # Relationships
     user = relationship("User", backref="strava_activities")
@@ -117,17 +138,36 @@ class StravaActivity(Base):
     def __repr__(self):
         return f"<StravaActivity {self.strava_id} {self.activity_type} {self.distance_m}m>"
 
-    @property
+    # Hybrid properties: usable both on instances and in SQL
+    # (e.g. .order_by(StravaActivity.pace_min_per_km)) so sorting and
+    # filtering run in the database instead of in Python. Both sides
+    # return unrounded values; rounding is left to display code.
+
+    @hybrid_property
     def distance_km(self) -> float:
         """Distance in kilometers."""
-        return round(self.distance_m / 1000, 2) if self.distance_m else 0
+        return self.distance_m / 1000 if self.distance_m else 0
 
-    @property
+    @distance_km.expression
+    def distance_km(cls):
+        return func.coalesce(cls.distance_m, 0) / 1000.0
+
+    @hybrid_property
     def pace_min_per_km(self) -> float | None:
         """Average pace in min/km."""
         if not self.distance_m or not self.moving_time_s or self.distance_m == 0:
             return None
-        return round((self.moving_time_s / 60) / (self.distance_m / 1000), 2)
+        return (self.moving_time_s / 60) / (self.distance_m / 1000)
+
+    @pace_min_per_km.expression
+    def pace_min_per_km(cls):
+        return case(
+            (
+                and_(cls.distance_m > 0, cls.moving_time_s > 0),
+                (cls.moving_time_s / 60.0) / (cls.distance_m / 1000.0),
+            ),
+            else_=None,
+        )
 
 
 class StravaActivitySplit(Base):
@@ -198,7 +238,7 @@ class StravaSyncStatus(Base):
     __tablename__ = "strava_sync_status"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(36), ForeignKey("users.id"), unique=True, nullable=False)
+    user_id = Column(UUIDString, ForeignKey("users.id"), unique=True, nullable=False)
 
     # Sync progress
     last_sync_at = Column(DateTime, nullable=True)
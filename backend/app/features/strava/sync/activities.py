@@ -5,15 +5,18 @@ Handles fetching and saving activities from Strava API.
 """
 
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 
 import httpx
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from ..models import StravaActivity, StravaToken
+from .config import SyncConfig
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +69,33 @@ class ActivitySyncService:
             response.raise_for_status()
             return response.json()
 
+    @staticmethod
+    def _activity_row(user_id: str, data: dict) -> dict:
+        """Map Strava API activity data to StravaActivity column values."""
+        # Parse start date (convert to naive UTC datetime for PostgreSQL)
+        start_date = datetime.fromisoformat(
+            data["start_date"].replace("Z", "+00:00")
+        ).replace(tzinfo=None)
+
+        return {
+            "user_id": user_id,
+            "strava_id": data["id"],
+            "name": data.get("name"),
+            "activity_type": data.get("type", "Unknown"),
+            "start_date": start_date,
+            "distance_m": data.get("distance"),
+            "moving_time_s": data.get("moving_time"),
+            "elapsed_time_s": data.get("elapsed_time"),
+            "elevation_gain_m": data.get("total_elevation_gain"),
+            "elevation_loss_m": data.get("elev_low"),  # Note: API returns elev_high/low
+            "avg_speed_mps": data.get("average_speed"),
+            "max_speed_mps": data.get("max_speed"),
+            "avg_heartrate": data.get("average_heartrate"),
+            "max_heartrate": data.get("max_heartrate"),
+            "avg_cadence": data.get("average_cadence"),
+            "suffer_score": data.get("suffer_score"),
+        }
+
     async def save_activity(
         self,
         user_id: str,
@@ -92,34 +122,49 @@ class ActivitySyncService:
         if existing:
             return None
 
-        # Parse start date (convert to naive UTC datetime for PostgreSQL)
-        start_date = datetime.fromisoformat(
-            data["start_date"].replace("Z", "+00:00")
-        ).replace(tzinfo=None)
-
-        activity = StravaActivity(
-            user_id=user_id,
-            strava_id=strava_id,
-            name=data.get("name"),
-            activity_type=data.get("type", "Unknown"),
-            start_date=start_date,
-            distance_m=data.get("distance"),
-            moving_time_s=data.get("moving_time"),
-            elapsed_time_s=data.get("elapsed_time"),
-            elevation_gain_m=data.get("total_elevation_gain"),
-            elevation_loss_m=data.get("elev_low"),  # Note: API returns elev_high/low
-            avg_speed_mps=data.get("average_speed"),
-            max_speed_mps=data.get("max_speed"),
-            avg_heartrate=data.get("average_heartrate"),
-            max_heartrate=data.get("max_heartrate"),
-            avg_cadence=data.get("average_cadence"),
-            suffer_score=data.get("suffer_score"),
-        )
+        activity = StravaActivity(**self._activity_row(user_id, data))
 
         self.db.add(activity)
         await self.db.flush()  # Get the ID assigned
         return activity
 
+    async def save_activities(
+        self,
+        user_id: str,
+        activities: list[dict]
+    ) -> list[StravaActivity]:
+        """
+        Save a batch of activities, skipping ones that already exist.
+
+        Uses multi-row INSERT ... ON CONFLICT (strava_id) DO NOTHING
+        RETURNING, so a batch costs one round trip per chunk instead of
+        a SELECT + INSERT per activity.
+
+        Args:
+            user_id: User ID
+            activities: Activity data list from Strava API
+
+        Returns:
+            Newly inserted activities (with IDs), in input order
+        """
+        saved: list[StravaActivity] = []
+        chunk_size = SyncConfig.ACTIVITY_INSERT_CHUNK_SIZE
+
+        for i in range(0, len(activities), chunk_size):
+            rows = [
+                self._activity_row(user_id, data)
+                for data in activities[i:i + chunk_size]
+            ]
+            stmt = (
+                pg_insert(StravaActivity)
+                .on_conflict_do_nothing(index_elements=["strava_id"])
+                .returning(StravaActivity, sort_by_parameter_order=True)
+            )
+            result = await self.db.scalars(stmt, rows)
+            saved.extend(result.all())
+
+        return saved
+
     async def get_valid_token(self, token: StravaToken) -> str:
         """
         Get valid access token, refreshing if needed.
@@ -130,7 +175,7 @@ class ActivitySyncService:
         Returns:
             Valid access token string
         """
-        if token.expires_at < datetime.utcnow().timestamp() + 300:
+        if token.expires_at < time.time() + 300:
             logger.info(f"Refreshing token for user {token.user_id}")
 
             async with httpx.AsyncClient() as client:
@@ -185,27 +185,29 @@ class BackgroundSyncRunner:
         from sqlalchemy import select
 
         async with self._db_factory() as db:
+            # One outer join instead of a sync-status SELECT per user (N+1).
+            # Only columns are fetched, so User's eager-loaded profiles and
+            # notifications are not pulled in either.
             result = await db.execute(
-                select(User).where(User.strava_connected == True)
+                select(
+                    User.id,
+                    StravaSyncStatus.id,
+                    StravaSyncStatus.last_sync_at,
+                )
+                .outerjoin(StravaSyncStatus, StravaSyncStatus.user_id == User.id)
+                .where(User.strava_connected == True)
             )
-            users = result.scalars().all()
+            rows = result.all()
 
             cutoff = datetime.utcnow() - timedelta(
                 hours=SyncConfig.MIN_SYNC_INTERVAL_HOURS
             )
 
-            for user in users:
-                result = await db.execute(
-                    select(StravaSyncStatus).where(
-                        StravaSyncStatus.user_id == user.id
-                    )
-                )
-                sync_status = result.scalar_one_or_none()
-
-                if not sync_status:
-                    await sync_queue.add_user(user.id, priority=True)
-                elif not sync_status.last_sync_at or sync_status.last_sync_at < cutoff:
-                    await sync_queue.add_user(user.id)
+            for user_id, sync_status_id, last_sync_at in rows:
+                if sync_status_id is None:
+                    await sync_queue.add_user(user_id, priority=True)
+                elif not last_sync_at or last_sync_at < cutoff:
+                    await sync_queue.add_user(user_id)
 
             logger.info(f"Refreshed sync queue: {sync_queue.queue_size} users")
 
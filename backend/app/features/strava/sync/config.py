@@ -29,6 +29,10 @@ class SyncConfig:
     # How many users to process per batch
     USERS_PER_BATCH = 5
 
+    # Max rows per multi-row INSERT when saving activities
+    # (keeps bind parameter count well under driver limits)
+    ACTIVITY_INSERT_CHUNK_SIZE = 500
+
     # Minimum interval between syncs for same user (hours)
     MIN_SYNC_INTERVAL_HOURS = 6
 
@@ -165,16 +165,12 @@ class StravaSyncService:
                 per_page=max_activities
             )
 
-            # Save activities and sync splits
-            saved_count = 0
+            # Save activities (one batched INSERT) and sync splits
             splits_synced_count = 0
-            saved_activities = []
-
-            for activity_data in activities:
-                activity = await self.activity_sync.save_activity(user_id, activity_data)
-                if activity:
-                    saved_count += 1
-                    saved_activities.append(activity)
+            saved_activities = await self.activity_sync.save_activities(
+                user_id, activities
+            )
+            saved_count = len(saved_activities)
 
             # Commit to get activity IDs
             await self.db.commit()
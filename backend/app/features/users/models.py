@@ -6,12 +6,11 @@ Models:
 - Notification: User notifications (sync progress, profile updates)
 """
 
-from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Boolean, Integer, BigInteger, ForeignKey, JSON
 from sqlalchemy.orm import relationship
 import uuid
 
-from app.models.base import Base
+from app.models.base import Base, UUIDString, utc_now
 
 
 class User(Base):
@@ -24,7 +23,7 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
     telegram_id = Column(BigInteger, unique=True, index=True, nullable=True)
     email = Column(String(255), unique=True, index=True, nullable=True)
 
@@ -42,8 +41,8 @@ class User(Base):
     onboarding_complete = Column(Boolean, default=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     # Relationships
     hiking_profile = relationship(
@@ -92,7 +91,7 @@ class Notification(Base):
     __tablename__ = "notifications"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUIDString, ForeignKey("users.id"), nullable=False, index=True)
 
     # Notification type
     type = Column(String(50), nullable=False)
@@ -104,7 +103,7 @@ class Notification(Base):
     read = Column(Boolean, default=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     # Relationships
     user = relationship("User", back_populates="notifications")
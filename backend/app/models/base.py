@@ -4,6 +4,51 @@ SQLAlchemy Base Model
 Shared base class for all models.
 """
 
+from sqlalchemy import DateTime, String, Uuid
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql.functions import FunctionElement
 
-Base = declarative_base()
+
+class _BaseConfig:
+    # Fetch server-generated values (server_default / SQL onupdate) via
+    # RETURNING in the same INSERT/UPDATE, so they are readable after
+    # flush without a lazy SELECT (which async sessions cannot do).
+    __mapper_args__ = {"eager_defaults": True}
+
+
+Base = declarative_base(cls=_BaseConfig)
+
+# UUID keys: native 16-byte uuid column, str values on the Python side.
+# The SQLite databases used by the analysis scripts store ids as hyphenated
+# varchar(36); a bare Uuid would bind 32-char hex there and match nothing.
+UUIDString = Uuid(as_uuid=False).with_variant(String(36), "sqlite")
+
+
+class _UTCNow(FunctionElement):
+    """Current UTC time as a naive timestamp, rendered per dialect."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(_UTCNow)
+def _compile_utc_now(element, compiler, **kw):
+    # SQLite (analysis scripts): CURRENT_TIMESTAMP is already naive UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(_UTCNow, "postgresql")
+def _compile_utc_now_postgresql(element, compiler, **kw):
+    return "timezone('UTC', now())"
+
+
+def utc_now():
+    """
+    SQL expression for the current UTC time as naive TIMESTAMP.
+
+    Same value datetime.utcnow() used to produce, but evaluated by the
+    database, so timestamp columns cost no Python call per row. Renders
+    timezone('UTC', now()) on Postgres and CURRENT_TIMESTAMP elsewhere.
+    """
+    return _UTCNow()
@@ -4,12 +4,11 @@ Prediction Model
 Stores prediction results and input parameters.
 """
 
-from datetime import datetime
 from enum import Enum
 from sqlalchemy import Column, String, DateTime, Float, Integer, ForeignKey, JSON, Enum as SQLEnum
 import uuid
 
-from app.models.base import Base
+from app.models.base import Base, UUIDString, utc_now
 from sqlalchemy.orm import relationship
 
 # Import enums from schemas (single source of truth)
@@ -27,13 +26,13 @@ class Prediction(Base):
 
     __tablename__ = "predictions"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
 
     # Type
     prediction_type = Column(SQLEnum(PredictionType), default=PredictionType.HIKE)
 
     # Input: GPX
-    gpx_file_id = Column(String(36), ForeignKey("gpx_files.id"), nullable=True)
+    gpx_file_id = Column(UUIDString, ForeignKey("gpx_files.id"), nullable=True)
 
     # Input: Hiker profile
     experience = Column(SQLEnum(ExperienceLevel), nullable=True)
@@ -56,14 +55,14 @@ class Prediction(Base):
     warnings = Column(JSON, nullable=True)
 
     # User
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=True)
+    user_id = Column(UUIDString, ForeignKey("users.id"), nullable=True)
 
     # Actual result (for accuracy tracking)
     actual_time_hours = Column(Float, nullable=True)
     accuracy_percent = Column(Float, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     # Relationships
     gpx_file = relationship("GPXFile", back_populates="predictions")
@@ -5,10 +5,9 @@ Stores historical snapshots of user profiles for tracking changes
 across profile improvements (IQR filtering, percentiles, etc).
 """
 
-from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Integer, JSON, ForeignKey
 
-from app.models.base import Base
+from app.models.base import Base, UUIDString, utc_now
 
 
 class ProfileSnapshot(Base):
@@ -24,12 +23,12 @@ class ProfileSnapshot(Base):
     __tablename__ = "profile_snapshots"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUIDString, ForeignKey("users.id"), nullable=False, index=True)
     profile_type = Column(String(20), nullable=False)  # "run" or "hiking"
     reason = Column(String(100), nullable=False)  # e.g. "phase_1_iqr", "manual_recalc"
     profile_data = Column(JSON, nullable=False)  # full profile snapshot
     activities_count = Column(Integer, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     def __repr__(self):
         return (
@@ -5,14 +5,45 @@ Stores calculated performance metrics from Strava Run activities.
 Used for personalizing trail running time predictions.
 """
 
-from datetime import datetime
+from operator import attrgetter
 from typing import Optional
-from sqlalchemy import Column, String, DateTime, Integer, Float, ForeignKey, JSON
+from sqlalchemy import Column, DateTime, Integer, Float, ForeignKey, JSON, case
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
-from app.models.base import Base
+from app.models.base import Base, UUIDString, utc_now
 from app.shared.constants import DEFAULT_HIKE_THRESHOLD_PERCENT
-from app.shared.gradients import LEGACY_CATEGORY_MAPPING
+from app.shared.gradients import LEGACY_CATEGORIES, LEGACY_CATEGORY_MAPPING
+
+
+# Legacy category -> sample count column name, built once at import
+_SAMPLE_COUNT_FIELDS = {cat: f"{cat}_sample_count" for cat in LEGACY_CATEGORIES}
+# 11-category -> legacy avg pace column name, built once at import
+_PACE_FIELDS = {
+    cat: f"avg_{legacy}_pace_min_km" for cat, legacy in LEGACY_CATEGORY_MAPPING.items()
+}
+
+# to_dict keys, in response order; each is the attribute of the same name
+_TO_DICT_KEYS = (
+    "avg_flat_pace_min_km",
+    "avg_gentle_uphill_pace_min_km",
+    "avg_moderate_uphill_pace_min_km",
+    "avg_steep_uphill_pace_min_km",
+    "avg_gentle_downhill_pace_min_km",
+    "avg_moderate_downhill_pace_min_km",
+    "avg_steep_downhill_pace_min_km",
+    "gradient_paces",
+    "gradient_percentiles",
+    "walk_threshold_percent",
+    "flat_speed_kmh",
+    "total_activities",
+    "total_distance_km",
+    "total_elevation_m",
+    "has_profile_data",
+    "has_extended_gradient_data",
+    "last_calculated_at",
+)
+_to_dict_values = attrgetter(*_TO_DICT_KEYS)
 
 
 class UserRunProfile(Base):
@@ -28,7 +59,7 @@ class UserRunProfile(Base):
     __tablename__ = "user_run_profiles"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(36), ForeignKey("users.id"), unique=True, nullable=False)
+    user_id = Column(UUIDString, ForeignKey("users.id"), unique=True, nullable=False)
 
     # === Pace metrics (7-category system) ===
     avg_flat_pace_min_km = Column(Float, nullable=True)
@@ -66,8 +97,8 @@ class UserRunProfile(Base):
 
     # === Metadata ===
     last_calculated_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
 
     # Relationship
     user = relationship("User", back_populates="run_profile")
@@ -95,35 +126,54 @@ class UserRunProfile(Base):
         )
         return has_uphill and has_downhill
 
-    @property
+    @hybrid_property
     def flat_speed_kmh(self) -> Optional[float]:
         """Convert flat pace to speed."""
         if self.avg_flat_pace_min_km and self.avg_flat_pace_min_km > 0:
-            return round(60 / self.avg_flat_pace_min_km, 2)
+            return 60.0 / self.avg_flat_pace_min_km
         return None
 
+    @flat_speed_kmh.expression
+    def flat_speed_kmh(cls):
+        return case(
+            (cls.avg_flat_pace_min_km > 0, 60.0 / cls.avg_flat_pace_min_km),
+            else_=None,
+        )
+
     def get_sample_count(self, category: str) -> int:
         """Get sample count for a legacy 7-category gradient."""
-        mapping = {
-            'flat': self.flat_sample_count,
-            'gentle_uphill': self.gentle_uphill_sample_count,
-            'moderate_uphill': self.moderate_uphill_sample_count,
-            'steep_uphill': self.steep_uphill_sample_count,
-            'gentle_downhill': self.gentle_downhill_sample_count,
-            'moderate_downhill': self.moderate_downhill_sample_count,
-            'steep_downhill': self.steep_downhill_sample_count,
-        }
-        return mapping.get(category, 0) or 0
+        field = _SAMPLE_COUNT_FIELDS.get(category)
+        if field is None:
+            return 0
+        return getattr(self, field) or 0
+
+    def _gradient_pace_lut(self) -> dict:
+        """
+        {category: (avg, samples)} view of gradient_paces.
+
+        Built once per JSON value: JSON columns are only ever replaced
+        (not mutated in place), so an identity check detects updates.
+        """
+        source = self.gradient_paces
+        cached = getattr(self, "_pace_lut_cache", None)
+        if cached is None or cached[0] is not source:
+            lut = {
+                cat: (data.get('avg'), data.get('samples', 0))
+                for cat, data in (source or {}).items()
+            }
+            cached = (source, lut)
+            self._pace_lut_cache = cached
+        return cached[1]
 
     def get_pace_for_category(self, category: str) -> Optional[float]:
         """Get avg pace from JSON (11-cat), fallback to legacy column (7-cat)."""
-        if self.gradient_paces and category in self.gradient_paces:
-            return self.gradient_paces[category].get('avg')
+        entry = self._gradient_pace_lut().get(category)
+        if entry is not None:
+            return entry[0]
         # Fallback to legacy column
-        legacy_name = LEGACY_CATEGORY_MAPPING.get(category)
-        if legacy_name:
-            field = f"avg_{legacy_name}_pace_min_km"
-            return getattr(self, field, None)
+        field = _PACE_FIELDS.get(category)
+        if field:
+            return getattr(self, field)
         return None
 
     def get_percentile(self, category: str, percentile: str) -> Optional[float]:
@@ -137,8 +187,9 @@ class UserRunProfile(Base):
 
     def get_sample_count_extended(self, category: str) -> int:
         """Get sample count from JSON (11-cat), fallback to legacy column."""
-        if self.gradient_paces and category in self.gradient_paces:
-            return self.gradient_paces[category].get('samples', 0)
+        entry = self._gradient_pace_lut().get(category)
+        if entry is not None:
+            return entry[1]
         # Fallback to legacy column
         legacy_name = LEGACY_CATEGORY_MAPPING.get(category)
         if legacy_name:
@@ -147,22 +198,11 @@ class UserRunProfile(Base):
 
     def to_dict(self) -> dict:
         """Convert to dict for API responses."""
-        return {
-            "avg_flat_pace_min_km": self.avg_flat_pace_min_km,
-            "avg_gentle_uphill_pace_min_km": self.avg_gentle_uphill_pace_min_km,
-            "avg_moderate_uphill_pace_min_km": self.avg_moderate_uphill_pace_min_km,
-            "avg_steep_uphill_pace_min_km": self.avg_steep_uphill_pace_min_km,
-            "avg_gentle_downhill_pace_min_km": self.avg_gentle_downhill_pace_min_km,
-            "avg_moderate_downhill_pace_min_km": self.avg_moderate_downhill_pace_min_km,
-            "avg_steep_downhill_pace_min_km": self.avg_steep_downhill_pace_min_km,
-            "gradient_paces": self.gradient_paces,
-            "gradient_percentiles": self.gradient_percentiles,
-            "walk_threshold_percent": self.walk_threshold_percent,
-            "flat_speed_kmh": self.flat_speed_kmh,
-            "total_activities": self.total_activities,
-            "total_distance_km": round(self.total_distance_km, 1) if self.total_distance_km else 0,
-            "total_elevation_m": round(self.total_elevation_m, 0) if self.total_elevation_m else 0,
-            "has_profile_data": self.has_profile_data,
-            "has_extended_gradient_data": self.has_extended_gradient_data,
-            "last_calculated_at": self.last_calculated_at.isoformat() if self.last_calculated_at else None,
-        }
+        data = dict(zip(_TO_DICT_KEYS, _to_dict_values(self)))
+        # Fields that need formatting are rewritten in place (keeps key order).
+        # Floats are emitted unrounded; clients format them for display.
+        data["total_distance_km"] = data["total_distance_km"] or 0
+        data["total_elevation_m"] = data["total_elevation_m"] or 0
+        calculated_at = data["last_calculated_at"]
+        data["last_calculated_at"] = calculated_at.isoformat() if calculated_at else None
+        return data
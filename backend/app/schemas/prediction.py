@@ -4,7 +4,7 @@ Prediction Schemas
 Pydantic models for prediction requests and responses.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -53,9 +53,34 @@ class WarningLevel(str, Enum):
     DANGER = "danger"
 
 
+class _RequestModel(BaseModel):
+    """Base for request models."""
+
+    # Validators are built on first use rather than at import
+    model_config = ConfigDict(defer_build=True)
+
+
+class _ResponseModel(BaseModel):
+    """
+    Base for response models: immutable once built.
+
+    Calculators already produce typed floats/strings, so validating them
+    again is pure overhead; such call sites use from_trusted(). Nested
+    models must then be passed as instances (built with from_trusted
+    too), not as dicts.
+    """
+
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+    @classmethod
+    def from_trusted(cls, **data):
+        """Build the model without validation."""
+        return cls.model_construct(**data)
+
+
 # === Request Models ===
 
-class HikePredictRequest(BaseModel):
+class HikePredictRequest(_RequestModel):
     """Request for hike prediction."""
     gpx_id: str
 
@@ -73,7 +98,7 @@ class HikePredictRequest(BaseModel):
     telegram_id: Optional[int] = None
 
 
-class GroupMemberInput(BaseModel):
+class GroupMemberInput(_RequestModel):
     """Input for a group member."""
     name: str
     experience: ExperienceLevel
@@ -81,7 +106,7 @@ class GroupMemberInput(BaseModel):
     has_children: bool = False
 
 
-class GroupPredictRequest(BaseModel):
+class GroupPredictRequest(_RequestModel):
     """Request for group prediction."""
     gpx_id: str
     members: List[GroupMemberInput]
@@ -90,14 +115,14 @@ class GroupPredictRequest(BaseModel):
 
 # === Response Models ===
 
-class Warning(BaseModel):
+class Warning(_ResponseModel):
     """Warning in prediction."""
     level: WarningLevel
     code: str
     message: str
 
 
-class SegmentPrediction(BaseModel):
+class SegmentPrediction(_ResponseModel):
     """Prediction for a route segment."""
     start_km: float
     end_km: float
@@ -107,14 +132,14 @@ class SegmentPrediction(BaseModel):
     predicted_minutes: float
 
 
-class TimeBreakdown(BaseModel):
+class TimeBreakdown(_ResponseModel):
     """Breakdown of estimated time."""
     moving_time_hours: float
     rest_time_hours: float
     lunch_time_hours: float
 
 
-class HikePrediction(BaseModel):
+class HikePrediction(_ResponseModel):
     """Response for hike prediction."""
     estimated_time_hours: float
     safe_time_hours: float
@@ -139,14 +164,14 @@ class HikePrediction(BaseModel):
     activities_used: int = 0
 
 
-class GroupMemberPrediction(BaseModel):
+class GroupMemberPrediction(_ResponseModel):
     """Prediction for a group member."""
     name: str
     individual_time_hours: float
     role: GroupRole
 
 
-class MeetingPoint(BaseModel):
+class MeetingPoint(_ResponseModel):
     """Suggested meeting point."""
     km: float
     name: str
@@ -155,7 +180,7 @@ class MeetingPoint(BaseModel):
     wait_time_minutes: int
 
 
-class GroupPrediction(BaseModel):
+class GroupPrediction(_ResponseModel):
     """Response for group prediction."""
     members: List[GroupMemberPrediction]
     group_time_hours: float
@@ -170,7 +195,7 @@ class GroupPrediction(BaseModel):
 
 # === Comparison Models (new) ===
 
-class MethodResultSchema(BaseModel):
+class MethodResultSchema(_ResponseModel):
     """Result from a single calculation method."""
     method_name: str
     speed_kmh: float
@@ -178,7 +203,7 @@ class MethodResultSchema(BaseModel):
     formula_used: str
 
 
-class MacroSegmentSchema(BaseModel):
+class MacroSegmentSchema(_ResponseModel):
     """A major route segment (ascent/descent section)."""
     segment_number: int
     segment_type: str  # "ascent", "descent", "flat"
@@ -190,10 +215,10 @@ class MacroSegmentSchema(BaseModel):
     end_elevation_m: float
 
     # Results by method name
-    methods: dict  # {"naismith": MethodResultSchema, "tobler": MethodResultSchema}
+    methods: Dict[str, MethodResultSchema]  # {"naismith": ..., "tobler": ...}
 
 
-class RouteComparisonResponse(BaseModel):
+class RouteComparisonResponse(_ResponseModel):
     """Response for route comparison with multiple methods."""
     # Route summary
     total_distance_km: float
@@ -208,14 +233,14 @@ class RouteComparisonResponse(BaseModel):
 
     # Totals by method (hours)
     # Can include: naismith, tobler, naismith_personalized, tobler_personalized
-    totals: dict
+    totals: Dict[str, float]
 
     # Rest/lunch time
     rest_time_hours: float = 0
     lunch_time_hours: float = 0
 
     # Method descriptions
-    method_descriptions: dict
+    method_descriptions: Dict[str, str]
 
     # Sun times
     sunrise: Optional[str] = None  # HH:MM
@@ -235,7 +260,7 @@ class RouteComparisonResponse(BaseModel):
 
 # === Trail Run Models ===
 
-class TrailRunCompareRequest(BaseModel):
+class TrailRunCompareRequest(_RequestModel):
     """Request for trail run method comparison."""
     gpx_id: str
     telegram_id: Optional[int] = None
@@ -270,7 +295,7 @@ class TrailRunCompareRequest(BaseModel):
     use_extended_gradients: bool = True
 
 
-class SegmentMovementInfo(BaseModel):
+class SegmentMovementInfo(_ResponseModel):
     """Movement info for a segment (trail run only)."""
     mode: str              # "run" | "hike"
     reason: str
@@ -278,7 +303,7 @@ class SegmentMovementInfo(BaseModel):
     confidence: float
 
 
-class TrailRunSegmentSchema(BaseModel):
+class TrailRunSegmentSchema(_ResponseModel):
     """Segment prediction for trail running."""
     segment_number: int
     start_km: float
@@ -297,7 +322,7 @@ class TrailRunSegmentSchema(BaseModel):
     fatigue_multiplier: float = 1.0
 
 
-class TrailRunSummarySchema(BaseModel):
+class TrailRunSummarySchema(_ResponseModel):
     """Summary statistics for trail run prediction."""
     total_distance_km: float
     total_elevation_gain_m: float
@@ -314,7 +339,7 @@ class TrailRunSummarySchema(BaseModel):
     elevation_impact_percent: float
 
 
-class TrailRunCompareResponse(BaseModel):
+class TrailRunCompareResponse(_ResponseModel):
     """Response for trail run comparison."""
     # Activity type
     activity_type: str = "trail_run"
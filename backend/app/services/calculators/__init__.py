@@ -4,6 +4,11 @@ DEPRECATED: Use app.features.hiking.calculators or app.features.trail_run.calcul
 This module re-exports for backward compatibility.
 These will be removed in a future version.
 
+Exports are resolved lazily (PEP 562 __getattr__): importing this package,
+or a submodule such as app.services.calculators.base, no longer pulls in
+every calculator, and the DeprecationWarning fires only when a moved name
+is actually used through this package.
+
 Migration guide:
 - from app.services.calculators import ToblerCalculator
   → from app.features.hiking.calculators import ToblerCalculator
@@ -11,129 +16,101 @@ Migration guide:
 - from app.services.calculators import GAPCalculator
   → from app.features.trail_run.calculators import GAPCalculator
 """
+import importlib
 import warnings
 
-warnings.warn(
-    "app.services.calculators is deprecated. "
-    "Use app.features.hiking.calculators or app.features.trail_run.calculators instead.",
-    DeprecationWarning,
-    stacklevel=2
-)
-
-# =============================================================================
-# Base classes - stay here (shared between hiking and trail_run)
-# =============================================================================
-from app.services.calculators.base import (
-    PaceCalculator,
-    MacroSegment,
-    SegmentType,
-    MethodResult,
-    CalculationResult,
-    SegmentCalculation,
-)
-
-# =============================================================================
-# Hiking calculators - re-export from features/hiking/calculators
-# MUST come before comparison to avoid circular import
-# =============================================================================
-from app.features.hiking.calculators import (
-    ToblerCalculator,
-    NaismithCalculator,
-    HikePersonalizationService,
-    HikeFatigueService,
-    FatigueConfig,
-    # Backward compatibility aliases
-    PersonalizationService,
-    FatigueService,
-    # Base classes and constants
-    BasePersonalizationService,
-    GRADIENT_THRESHOLDS,
-    MIN_ACTIVITIES_FOR_PROFILE,
-    FLAT_GRADIENT_MIN,
-    FLAT_GRADIENT_MAX,
-)
-
-# =============================================================================
-# Trail run calculators - re-export from features/trail_run/calculators
-# =============================================================================
-from app.features.trail_run.calculators import (
-    GAPCalculator,
-    GAPMode,
-    GAPResult,
-    STRAVA_GAP_TABLE,
-    compare_gap_modes,
-    HikeRunThresholdService,
-    HikeRunDecision,
-    MovementMode,
-    RunPersonalizationService,
-    RunnerFatigueService,
-    RunnerFatigueConfig,
-    FATIGUE_THRESHOLD_HOURS,
-    LINEAR_DEGRADATION,
-    QUADRATIC_DEGRADATION,
-    DOWNHILL_FATIGUE_MULTIPLIER,
-)
-
-# =============================================================================
-# Segmenter
-# =============================================================================
-from app.features.gpx.segmenter import RouteSegmenter
-
-# =============================================================================
-# Comparison service - MUST come AFTER hiking/trail_run to avoid circular import
-# (comparison.py imports from hiking/calculators)
-# =============================================================================
-from app.services.calculators.comparison import (
-    ComparisonService,
-    SegmentComparison,
-    RouteComparison,
-)
-
-__all__ = [
+_BASE = "app.services.calculators.base"
+_COMPARISON = "app.services.calculators.comparison"
+_HIKING = "app.features.hiking.calculators"
+_TRAIL_RUN = "app.features.trail_run.calculators"
+_SEGMENTER = "app.features.gpx.segmenter"
+
+# Exported name -> module that defines it
+_EXPORTS = {
     # Base classes (stay here)
-    "PaceCalculator",
-    "MacroSegment",
-    "SegmentType",
-    "MethodResult",
-    "CalculationResult",
-    "SegmentCalculation",
+    **dict.fromkeys((
+        "PaceCalculator",
+        "MacroSegment",
+        "SegmentType",
+        "MethodResult",
+        "MethodResultBatch",
+        "CalculationResult",
+        "SegmentCalculation",
+    ), _BASE),
 
     # Segmenter (now in features/gpx)
-    "RouteSegmenter",
+    "RouteSegmenter": _SEGMENTER,
 
     # Comparison (stays here)
-    "ComparisonService",
-    "SegmentComparison",
-    "RouteComparison",
+    **dict.fromkeys((
+        "ComparisonService",
+        "SegmentComparison",
+        "RouteComparison",
+    ), _COMPARISON),
 
     # Hiking calculators (from features/hiking)
-    "ToblerCalculator",
-    "NaismithCalculator",
-    "HikePersonalizationService",
-    "HikeFatigueService",
-    "FatigueConfig",
-    "PersonalizationService",  # deprecated alias
-    "FatigueService",  # deprecated alias
-    "BasePersonalizationService",
-    "GRADIENT_THRESHOLDS",
-    "MIN_ACTIVITIES_FOR_PROFILE",
-    "FLAT_GRADIENT_MIN",
-    "FLAT_GRADIENT_MAX",
+    **dict.fromkeys((
+        "ToblerCalculator",
+        "NaismithCalculator",
+        "HikePersonalizationService",
+        "HikeFatigueService",
+        "FatigueConfig",
+        "PersonalizationService",  # deprecated alias
+        "FatigueService",  # deprecated alias
+        "BasePersonalizationService",
+        "GRADIENT_THRESHOLDS",
+        "MIN_ACTIVITIES_FOR_PROFILE",
+        "FLAT_GRADIENT_MIN",
+        "FLAT_GRADIENT_MAX",
+    ), _HIKING),
 
     # Trail run calculators (from features/trail_run)
-    "GAPCalculator",
-    "GAPMode",
-    "GAPResult",
-    "STRAVA_GAP_TABLE",
-    "compare_gap_modes",
-    "HikeRunThresholdService",
-    "HikeRunDecision",
-    "MovementMode",
-    "RunPersonalizationService",
-    "RunnerFatigueService",
-    "RunnerFatigueConfig",
-    "FATIGUE_THRESHOLD_HOURS",
-    "LINEAR_DEGRADATION",
-    "QUADRATIC_DEGRADATION",
-    "DOWNHILL_FATIGUE_MULTIPLIER",
-]
+    **dict.fromkeys((
+        "GAPCalculator",
+        "GAPMode",
+        "GAPResult",
+        "STRAVA_GAP_TABLE",
+        "compare_gap_modes",
+        "HikeRunThresholdService",
+        "HikeRunDecision",
+        "MovementMode",
+        "RunPersonalizationService",
+        "RunnerFatigueService",
+        "RunnerFatigueConfig",
+        "FATIGUE_THRESHOLD_HOURS",
+        "LINEAR_DEGRADATION",
+        "QUADRATIC_DEGRADATION",
+        "DOWNHILL_FATIGUE_MULTIPLIER",
+    ), _TRAIL_RUN),
+}
+
+# Names that moved to features/ and are only re-exported here
+_DEPRECATED_MODULES = frozenset({_HIKING, _TRAIL_RUN, _SEGMENTER})
+
+__all__ = list(_EXPORTS)
+
+_deprecation_warned = False
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    global _deprecation_warned
+    if module_name in _DEPRECATED_MODULES and not _deprecation_warned:
+        _deprecation_warned = True
+        warnings.warn(
+            "app.services.calculators is deprecated. "
+            "Use app.features.hiking.calculators or app.features.trail_run.calculators instead.",
+            DeprecationWarning,
+            stacklevel=2
+        )
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,6 +10,7 @@ from app.shared.calculator_types import (
     SegmentType,
     MacroSegment,
     MethodResult,
+    MethodResultBatch,
     SegmentCalculation,
     CalculationResult,
     PaceCalculator,
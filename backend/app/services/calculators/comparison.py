@@ -6,12 +6,16 @@ Supports optional personalization based on user's Strava activity data.
 Supports optional fatigue modeling for long routes.
 """
 
+import copy
+import io
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 
+from sqlalchemy import inspect
+
 from app.services.calculators.base import (
     PaceCalculator,
-    MacroSegment,
     MethodResult,
     SegmentType
 )
@@ -21,13 +25,85 @@ from app.features.hiking.calculators import (
     ToblerCalculator,
     PersonalizationService,
     FatigueService,
-    FatigueConfig,
 )
 from app.features.hiking.models import UserHikingProfile
 from app.shared.calculator_types import EffortLevel
 
+# format_comparison labels
+_SEG_TYPE_RU = {
+    "ascent": "Подъём",
+    "descent": "Спуск",
+    "flat": "Ровный",
+}
+_TOTALS_SEPARATOR = "=" * 40
+_SEGMENT_TEMPLATE = (
+    "Часть %s: %s (%s км, %s м)\n"
+    "  Градиент: %s%% (%s°)\n"
+    "  Высота: %.0fм → %.0fм\n"
+)
+_METHOD_TEMPLATE = "  [%s] %s км/ч → %s\n"
+
+# Personalized method names in segment/totals order
+_PERSONALIZED_METHODS = ("tobler_personalized", "naismith_personalized")
+
+# Personalization services are read-only after construction, so the
+# per-effort set for a profile is reused across requests. The key changes
+# whenever the profile is recalculated (last_calculated_at is bumped).
+# Services are built from a session-free copy of the profile, never from
+# the ORM instance of the request that first filled the entry.
+_PERSONALIZATION_CACHE_SIZE = 256
+_personalization_cache: OrderedDict[
+    tuple, Dict[EffortLevel, PersonalizationService]
+] = OrderedDict()
+
+
+def _get_personalization(
+    user_profile: UserHikingProfile,
+    use_extended_gradients: bool
+) -> Dict[EffortLevel, PersonalizationService]:
+    """Get the personalization service for each effort level, cached per profile state."""
+    key = (
+        user_profile.user_id,
+        user_profile.total_activities_analyzed,
+        user_profile.last_calculated_at,
+        use_extended_gradients,
+    )
+    services = _personalization_cache.get(key)
+    if services is not None:
+        _personalization_cache.move_to_end(key)
+        return services
+
+    snapshot = _snapshot_profile(user_profile)
+    services = {
+        effort: PersonalizationService(
+            snapshot,
+            use_extended_gradients=use_extended_gradients,
+            effort=effort,
+        )
+        for effort in EffortLevel
+    }
+    _personalization_cache[key] = services
+    if len(_personalization_cache) > _PERSONALIZATION_CACHE_SIZE:
+        _personalization_cache.popitem(last=False)
+    return services
+
+
+def _snapshot_profile(user_profile: UserHikingProfile) -> UserHikingProfile:
+    """
+    Transient copy of the profile's column values.
+
+    The copy belongs to no session, so it never lazy-loads: a rollback or
+    expire_all() on the session that loaded the original cannot turn
+    later reads from cached services into DetachedInstanceError.
+    """
+    mapper = inspect(user_profile).mapper
+    return mapper.class_(**{
+        attr.key: copy.deepcopy(getattr(user_profile, attr.key))
+        for attr in mapper.column_attrs
+    })
 
-@dataclass
+
+@dataclass(slots=True)
 class SegmentComparison:
     """Comparison of methods for a single segment."""
     segment_number: int
@@ -43,7 +119,7 @@ class SegmentComparison:
     methods: Dict[str, MethodResult] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteComparison:
     """Full route comparison with all segments and methods."""
     # Route summary
@@ -80,10 +156,19 @@ class ComparisonService:
     """
 
     def __init__(self):
-        self.calculators: List[PaceCalculator] = [
+        self.calculators: Tuple[PaceCalculator, ...] = (
             NaismithCalculator(),
             ToblerCalculator(),
-        ]
+        )
+        # Per-call templates; copied before use since results own their dicts
+        self._names: Tuple[str, ...] = tuple(c.name for c in self.calculators)
+        self._descriptions: Dict[str, str] = {
+            c.name: c.description for c in self.calculators
+        }
+        self._zero_totals: Dict[str, float] = dict.fromkeys(self._names, 0.0)
+        self._calc_pairs: Tuple[Tuple[PaceCalculator, str], ...] = tuple(
+            zip(self.calculators, self._names)
+        )
 
     def compare_route(
         self,
@@ -91,7 +176,8 @@ class ComparisonService:
         profile_multiplier: float = 1.0,
         user_profile: Optional[UserHikingProfile] = None,
         use_extended_gradients: bool = True,
-        apply_fatigue: bool = False
+        apply_fatigue: bool = False,
+        include_segments: bool = True
     ) -> RouteComparison:
         """
         Compare all methods on a route.
@@ -102,6 +188,8 @@ class ComparisonService:
             user_profile: Optional user profile for personalized calculations
             use_extended_gradients: Use 7-category gradient system for personalization
             apply_fatigue: Apply fatigue model to calculations
+            include_segments: Build the per-segment breakdown. When False,
+                only totals are computed and segments is left empty.
 
         Returns:
             RouteComparison with segment-by-segment and total results
@@ -112,19 +200,20 @@ class ComparisonService:
         if not macro_segments:
             return self._empty_comparison(user_profile)
 
-        # Calculate totals
-        total_distance = sum(s.distance_km for s in macro_segments)
-        total_ascent = sum(s.elevation_gain_m for s in macro_segments)
-        total_descent = sum(s.elevation_loss_m for s in macro_segments)
-
-        ascent_distance = sum(
-            s.distance_km for s in macro_segments
-            if s.segment_type == SegmentType.ASCENT
-        )
-        descent_distance = sum(
-            s.distance_km for s in macro_segments
-            if s.segment_type == SegmentType.DESCENT
-        )
+        # Calculate totals (one pass over the segments). Integer zero starts,
+        # like sum(): a route with no descent still reports "0 км".
+        total_distance = total_ascent = total_descent = 0
+        ascent_distance = descent_distance = 0
+        ascent, descent = SegmentType.ASCENT, SegmentType.DESCENT
+        for s in macro_segments:
+            distance = s.distance_km
+            total_distance += distance
+            total_ascent += s.elevation_gain_m
+            total_descent += s.elevation_loss_m
+            if s.segment_type is ascent:
+                ascent_distance += distance
+            elif s.segment_type is descent:
+                descent_distance += distance
 
         # Setup personalization if profile is valid (3 effort levels)
         personalization = None
@@ -133,12 +222,9 @@ class ComparisonService:
         activities_used = 0
 
         if PersonalizationService.is_profile_valid(user_profile):
-            for effort in EffortLevel:
-                personalization_by_effort[effort] = PersonalizationService(
-                    user_profile,
-                    use_extended_gradients=use_extended_gradients,
-                    effort=effort,
-                )
+            personalization_by_effort = _get_personalization(
+                user_profile, use_extended_gradients
+            )
             # Default (MODERATE) for backward compat
             personalization = personalization_by_effort[EffortLevel.MODERATE]
             is_personalized = True
@@ -151,7 +237,7 @@ class ComparisonService:
 
         # Compare each segment
         segment_comparisons = []
-        method_totals: Dict[str, float] = {c.name: 0.0 for c in self.calculators}
+        method_totals = self._zero_totals.copy()
 
         # Add personalized method totals if profile available
         if personalization:
@@ -162,84 +248,105 @@ class ComparisonService:
                 method_totals[f"tobler_personalized_{effort.value}"] = 0.0
                 method_totals[f"naismith_personalized_{effort.value}"] = 0.0
 
-        # Track cumulative time per method for fatigue calculation
-        cumulative_times: Dict[str, float] = {k: 0.0 for k in method_totals.keys()}
-
-        for segment in macro_segments:
-            comparison = SegmentComparison(
-                segment_number=segment.segment_number,
-                segment_type=segment.segment_type.value,
-                distance_km=segment.distance_km,
-                elevation_change_m=segment.elevation_change_m,
-                gradient_percent=round(segment.gradient_percent, 1),
-                gradient_degrees=round(segment.gradient_degrees, 1),
-                start_elevation_m=segment.start_elevation_m,
-                end_elevation_m=segment.end_elevation_m,
-                methods={}
-            )
+        # Cumulative time per base method (by _calc_pairs index) and for the
+        # personalized methods, which share one timeline; fatigue only
+        cumulative_times = [0.0] * len(self._calc_pairs)
+        personal_cumulative = 0.0
+
+        if include_segments:
+            for segment in macro_segments:
+                comparison = SegmentComparison(
+                    segment_number=segment.segment_number,
+                    segment_type=segment.segment_type.value,
+                    distance_km=segment.distance_km,
+                    elevation_change_m=segment.elevation_change_m,
+                    gradient_percent=round(segment.gradient_percent, 1),
+                    gradient_degrees=round(segment.gradient_degrees, 1),
+                    start_elevation_m=segment.start_elevation_m,
+                    end_elevation_m=segment.end_elevation_m,
+                    methods={}
+                )
 
-            # Calculate with base methods
-            for calculator in self.calculators:
-                result = calculator.calculate_segment(segment, profile_multiplier)
-
-                # Apply fatigue if enabled
-                if fatigue_service:
-                    adjusted_time, fatigue_mult = fatigue_service.apply_to_segment(
-                        result.time_hours,
-                        cumulative_times[calculator.name]
-                    )
-                    # Update result with fatigue-adjusted time
-                    result = MethodResult(
-                        method_name=result.method_name,
-                        speed_kmh=result.speed_kmh,
-                        time_hours=round(adjusted_time, 4),
-                        formula_used=f"{result.formula_used} [fatigue ×{fatigue_mult:.2f}]"
-                    )
-                    cumulative_times[calculator.name] += adjusted_time
-                else:
-                    cumulative_times[calculator.name] += result.time_hours
-
-                comparison.methods[calculator.name] = result
-                method_totals[calculator.name] += result.time_hours
-
-            # Calculate with personalized methods (MODERATE for segments, all for totals)
-            if personalization:
-                for base_method in ["tobler", "naismith"]:
-                    # MODERATE result goes into segment comparison (legacy compat)
-                    result = personalization.calculate_segment(segment, base_method)
+                # Calculate with base methods
+                for i, (calculator, name) in enumerate(self._calc_pairs):
+                    result = calculator.calculate_segment(segment, profile_multiplier)
 
                     # Apply fatigue if enabled
                     if fatigue_service:
                         adjusted_time, fatigue_mult = fatigue_service.apply_to_segment(
                             result.time_hours,
-                            cumulative_times[result.method_name]
+                            cumulative_times[i]
                         )
-                        result = MethodResult(
-                            method_name=result.method_name,
-                            speed_kmh=result.speed_kmh,
-                            time_hours=round(adjusted_time, 4),
-                            formula_used=f"{result.formula_used} [fatigue ×{fatigue_mult:.2f}]"
+                        # Update result with fatigue-adjusted time (the result
+                        # is freshly built for this segment, so edit in place)
+                        result.time_hours = round(adjusted_time, 4)
+                        result.formula_used += f" [fatigue ×{fatigue_mult:.2f}]"
+                        cumulative_times[i] += adjusted_time
+
+                    comparison.methods[name] = result
+                    method_totals[name] += result.time_hours
+
+                # Calculate with personalized methods (MODERATE for segments, all for totals).
+                # The personal pace does not depend on the base method, and both
+                # methods accumulate the same times, so the result (and its
+                # fatigue adjustment) is computed once and emitted under both names.
+                if personalization:
+                    personal = personalization.calculate_segment(segment)
+                    time_hours = personal.time_hours
+                    formula = personal.formula_used
+
+                    # Apply fatigue if enabled
+                    if fatigue_service:
+                        adjusted_time, fatigue_mult = fatigue_service.apply_to_segment(
+                            time_hours,
+                            personal_cumulative
                         )
-                        cumulative_times[result.method_name] += adjusted_time
-                    else:
-                        cumulative_times[result.method_name] += result.time_hours
+                        personal_cumulative += adjusted_time
+                        time_hours = round(adjusted_time, 4)
+                        formula = f"{formula} [fatigue ×{fatigue_mult:.2f}]"
 
-                    comparison.methods[result.method_name] = result
-                    method_totals[result.method_name] += result.time_hours
+                    # MODERATE result goes into segment comparison (legacy compat)
+                    for method_name in _PERSONALIZED_METHODS:
+                        comparison.methods[method_name] = MethodResult(
+                            method_name=method_name,
+                            speed_kmh=personal.speed_kmh,
+                            time_hours=time_hours,
+                            formula_used=formula
+                        )
+                        method_totals[method_name] += time_hours
 
-                    # Effort level totals (all 3 levels)
-                    for effort, pers in personalization_by_effort.items():
-                        effort_result = pers.calculate_segment(segment, base_method)
-                        key = f"{base_method}_personalized_{effort.value}"
-                        method_totals[key] += effort_result.time_hours
+                segment_comparisons.append(comparison)
 
-            segment_comparisons.append(comparison)
+        else:
+            # Totals only: per-method time columns, no per-segment results
+            for calculator, name in self._calc_pairs:
+                method_totals[name] = self._column_total(
+                    calculator.calculate_route_hours(macro_segments, profile_multiplier),
+                    fatigue_service
+                )
+            if personalization:
+                personal_total = self._column_total(
+                    personalization.calculate_route_hours(macro_segments),
+                    fatigue_service
+                )
+                for method_name in _PERSONALIZED_METHODS:
+                    method_totals[method_name] = personal_total
+
+        # Effort level totals (all 3 levels): only the times are needed, so
+        # compute them column-wise per effort instead of building a
+        # MethodResult per segment. The pace does not depend on the base
+        # method, so tobler/naismith share one column.
+        for effort, pers in personalization_by_effort.items():
+            effort_total = sum(pers.calculate_route_hours(macro_segments))
+            for base_method in ("tobler", "naismith"):
+                method_totals[f"{base_method}_personalized_{effort.value}"] = effort_total
 
         # Round totals
-        method_totals = {k: round(v, 2) for k, v in method_totals.items()}
+        for key, total in method_totals.items():
+            method_totals[key] = round(total, 2)
 
         # Method descriptions
-        descriptions = {c.name: c.description for c in self.calculators}
+        descriptions = self._descriptions.copy()
 
         # Add personalized descriptions if available
         if personalization:
@@ -271,13 +378,30 @@ class ComparisonService:
             fatigue_info=fatigue_info
         )
 
+    @staticmethod
+    def _column_total(
+        times: List[float],
+        fatigue_service: Optional[FatigueService]
+    ) -> float:
+        """
+        Total of one method's segment times, as the segment loop accumulates it.
+
+        With fatigue, each time is adjusted against the unrounded cumulative
+        time and the rounded adjusted time is added to the total.
+        """
+        if not fatigue_service:
+            return sum(times)
+
+        adjusted_times, _, _ = fatigue_service.apply_to_route(times)
+        return sum(round(adjusted_time, 4) for adjusted_time in adjusted_times)
+
     def _empty_comparison(
         self,
         user_profile: Optional[UserHikingProfile] = None
     ) -> RouteComparison:
         """Return empty comparison for invalid routes."""
-        totals = {c.name: 0.0 for c in self.calculators}
-        descriptions = {c.name: c.description for c in self.calculators}
+        totals = self._zero_totals.copy()
+        descriptions = self._descriptions.copy()
 
         # Add personalized methods if profile valid
         is_personalized = False
@@ -312,62 +436,51 @@ class ComparisonService:
 
         Useful for debugging and bot output.
         """
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
+        format_time = self._format_time
 
         # Header
-        lines.append(f"Маршрут: {comparison.total_distance_km} км")
-        lines.append(
-            f"  Подъём: {comparison.ascent_distance_km} км (+{comparison.total_ascent_m:.0f} м)"
+        write(f"Маршрут: {comparison.total_distance_km} км\n")
+        write(
+            f"  Подъём: {comparison.ascent_distance_km} км (+{comparison.total_ascent_m:.0f} м)\n"
         )
-        lines.append(
-            f"  Спуск: {comparison.descent_distance_km} км (-{comparison.total_descent_m:.0f} м)"
+        write(
+            f"  Спуск: {comparison.descent_distance_km} км (-{comparison.total_descent_m:.0f} м)\n"
         )
-        lines.append("")
+        write("\n")
 
         # Segments
         for seg in comparison.segments:
-            seg_type_ru = {
-                "ascent": "Подъём",
-                "descent": "Спуск",
-                "flat": "Ровный"
-            }.get(seg.segment_type, seg.segment_type)
+            seg_type_ru = _SEG_TYPE_RU.get(seg.segment_type, seg.segment_type)
 
             ele_str = f"+{seg.elevation_change_m:.0f}" if seg.elevation_change_m >= 0 else f"{seg.elevation_change_m:.0f}"
 
-            lines.append(
-                f"Часть {seg.segment_number}: {seg_type_ru} "
-                f"({seg.distance_km} км, {ele_str} м)"
-            )
-            lines.append(
-                f"  Градиент: {seg.gradient_percent}% ({seg.gradient_degrees}°)"
-            )
-            lines.append(
-                f"  Высота: {seg.start_elevation_m:.0f}м → {seg.end_elevation_m:.0f}м"
-            )
+            write(_SEGMENT_TEMPLATE % (
+                seg.segment_number, seg_type_ru, seg.distance_km, ele_str,
+                seg.gradient_percent, seg.gradient_degrees,
+                seg.start_elevation_m, seg.end_elevation_m,
+            ))
 
             for method_name, result in seg.methods.items():
-                time_str = self._format_time(result.time_hours)
-                lines.append(
-                    f"  [{method_name}] {result.speed_kmh} км/ч → {time_str}"
-                )
+                write(_METHOD_TEMPLATE % (
+                    method_name, result.speed_kmh, format_time(result.time_hours)
+                ))
 
-            lines.append("")
+            write("\n")
 
         # Totals
-        lines.append("=" * 40)
-        lines.append("ИТОГО (чистое время движения):")
+        write(_TOTALS_SEPARATOR)
+        write("\nИТОГО (чистое время движения):")
         for method_name, total_hours in comparison.totals.items():
-            time_str = self._format_time(total_hours)
-            desc = comparison.method_descriptions.get(method_name, "")
-            lines.append(f"  {method_name}: {time_str}")
+            write(f"\n  {method_name}: {format_time(total_hours)}")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     @staticmethod
     def _format_time(hours: float) -> str:
-        """Format hours as 'Xч Yмин'."""
-        h = int(hours)
-        m = int((hours - h) * 60)
+        """Format hours as 'Xч Yмин', rounded to the nearest minute."""
+        h, m = divmod(int(hours * 60 + 0.5), 60)
         if h > 0:
             return f"{h}ч {m}мин"
         return f"{m}мин"
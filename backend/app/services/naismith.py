@@ -78,25 +78,29 @@ def naismith_with_descent(
     return base_time
 
 
+# Time multipliers by experience level and backpack weight
+_EXPERIENCE_MULTIPLIERS = {
+    ExperienceLevel.BEGINNER: 1.5,
+    ExperienceLevel.CASUAL: 1.2,
+    ExperienceLevel.REGULAR: 1.0,
+    ExperienceLevel.EXPERIENCED: 0.85
+}
+
+_BACKPACK_MULTIPLIERS = {
+    BackpackWeight.LIGHT: 1.0,
+    BackpackWeight.MEDIUM: 1.1,
+    BackpackWeight.HEAVY: 1.25
+}
+
+
 def get_experience_multiplier(experience: ExperienceLevel) -> float:
     """Get time multiplier based on experience."""
-    multipliers = {
-        ExperienceLevel.BEGINNER: 1.5,
-        ExperienceLevel.CASUAL: 1.2,
-        ExperienceLevel.REGULAR: 1.0,
-        ExperienceLevel.EXPERIENCED: 0.85
-    }
-    return multipliers.get(experience, 1.0)
+    return _EXPERIENCE_MULTIPLIERS.get(experience, 1.0)
 
 
 def get_backpack_multiplier(backpack: BackpackWeight) -> float:
     """Get time multiplier based on backpack weight."""
-    multipliers = {
-        BackpackWeight.LIGHT: 1.0,
-        BackpackWeight.MEDIUM: 1.1,
-        BackpackWeight.HEAVY: 1.25
-    }
-    return multipliers.get(backpack, 1.0)
+    return _BACKPACK_MULTIPLIERS.get(backpack, 1.0)
 
 
 def get_group_multiplier(group_size: int) -> float:
@@ -186,10 +190,7 @@ def calculate_start_time(
     # Add 20% safety margin
     safe_duration = estimated_hours * 1.2
 
-    start_hour = target_return - safe_duration
-
     # Not earlier than 5 AM
-    if start_hour < 5:
-        start_hour = 5
+    start_hour = max(target_return - safe_duration, 5)
 
     return f"{int(start_hour):02d}:00"
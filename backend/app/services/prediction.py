@@ -6,6 +6,7 @@ Supports personalization based on user's Strava activity history.
 """
 
 import logging
+from collections import OrderedDict
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
@@ -41,6 +42,12 @@ from app.features.hiking import UserHikingProfile as UserPerformanceProfile
 
 logger = logging.getLogger(__name__)
 
+# GPX files are never modified after upload, so a route's UI segments are
+# parsed once and reused across predictions. gpx_id -> segments, least
+# recently used first.
+_SEGMENTS_CACHE_SIZE = 64
+_segments_cache: OrderedDict[str, List[GPXSegment]] = OrderedDict()
+
 
 class PredictionService:
     """Service for time predictions."""
@@ -81,24 +88,68 @@ class PredictionService:
         Raises:
             ValueError: If GPX file not found
         """
+        # The GPX content is only needed to build the UI segments: skip
+        # loading (and decompressing) it when they are already cached.
+        # Holding the list also keeps it usable if it is evicted meanwhile.
+        cached_segments = _segments_cache.get(gpx_id)
+        if cached_segments is not None:
+            _segments_cache.move_to_end(gpx_id)
+
         # Fetch GPX data from database
         gpx_repo = GPXRepository(db)
-        gpx_file = await gpx_repo.get_by_id(gpx_id)
+        gpx_file = await gpx_repo.get_by_id(
+            gpx_id, with_content=cached_segments is None
+        )
 
         if not gpx_file:
             raise ValueError(f"GPX file not found: {gpx_id}")
 
-        distance_km = gpx_file.distance_km or 0.0
-        elevation_gain_m = gpx_file.elevation_gain_m or 0.0
-        elevation_loss_m = gpx_file.elevation_loss_m or 0.0
-        max_altitude_m = gpx_file.max_elevation_m or 0.0
-
         # Get sun times from route coordinates
         if gpx_file.start_lat and gpx_file.start_lon:
             sun_times = get_sun_times(gpx_file.start_lat, gpx_file.start_lon)
             sunrise = sun_times.sunrise
             sunset = sun_times.sunset
 
+        return PredictionService._predict_for_gpx(
+            gpx_file,
+            experience=experience,
+            backpack=backpack,
+            group_size=group_size,
+            has_children=has_children,
+            has_elderly=has_elderly,
+            is_round_trip=is_round_trip,
+            sunset=sunset,
+            user_profile=user_profile,
+            gpx_segments=cached_segments
+        )
+
+    @staticmethod
+    def _predict_for_gpx(
+        gpx_file,
+        experience: ExperienceLevel,
+        backpack: BackpackWeight,
+        group_size: int,
+        has_children: bool,
+        has_elderly: bool,
+        is_round_trip: bool,
+        sunset: str,
+        user_profile: Optional[UserPerformanceProfile] = None,
+        include_segments: bool = True,
+        gpx_segments: Optional[List[GPXSegment]] = None
+    ) -> HikePrediction:
+        """
+        Hike prediction for an already loaded GPX file.
+
+        With include_segments=False the per-segment breakdown is skipped
+        (segments is empty) and only the route totals are read, so
+        gpx_file may also be a GPXInfo from GPXRepository.get_info().
+        gpx_file.content is only read when gpx_segments is not given.
+        """
+        distance_km = gpx_file.distance_km or 0.0
+        elevation_gain_m = gpx_file.elevation_gain_m or 0.0
+        elevation_loss_m = gpx_file.elevation_loss_m or 0.0
+        max_altitude_m = gpx_file.max_elevation_m or 0.0
+
         # Create hiker profile
         profile = HikerProfile(
             experience=experience,
@@ -196,7 +247,7 @@ class PredictionService:
         safe_time = adjusted_time * 1.2
 
         # Create time breakdown
-        time_breakdown = TimeBreakdown(
+        time_breakdown = TimeBreakdown.from_trusted(
             moving_time_hours=round(moving_time, 2),
             rest_time_hours=round(rest_time, 2),
             lunch_time_hours=round(lunch_time, 2)
@@ -214,20 +265,23 @@ class PredictionService:
 
         # Add personalization info to warnings if used
         if personalized:
-            warnings.insert(0, Warning(
+            warnings.insert(0, Warning.from_trusted(
                 level=WarningLevel.INFO,
                 code="personalized",
                 message=f"Prediction personalized based on {user_profile.total_activities_analyzed} activities"
             ))
 
         # Calculate segment breakdown
-        segments = PredictionService._calculate_segments(
-            gpx_file.gpx_content,
-            total_multiplier,
-            user_profile
-        )
+        segments = []
+        if include_segments:
+            segments = PredictionService._calculate_segments(
+                gpx_file,
+                total_multiplier,
+                user_profile,
+                gpx_segments
+            )
 
-        return HikePrediction(
+        return HikePrediction.from_trusted(
             estimated_time_hours=round(adjusted_time, 1),
             safe_time_hours=round(safe_time, 1),
             recommended_start=recommended_start,
@@ -331,20 +385,28 @@ class PredictionService:
 
         Analyzes each member and provides recommendations.
         """
+        # Route totals are all the member estimates need: take them from
+        # the cached GPX metadata, and skip segments and sun times
+        gpx_file = await GPXRepository(db).get_info(gpx_id)
+
+        if not gpx_file:
+            raise ValueError(f"GPX file not found: {gpx_id}")
+
         # Calculate individual predictions
         member_predictions = []
 
         for member in members:
             # Simple prediction for each member
-            prediction = await PredictionService.predict_hike(
-                gpx_id=gpx_id,
+            prediction = PredictionService._predict_for_gpx(
+                gpx_file,
                 experience=member.experience,
                 backpack=member.backpack,
                 group_size=1,  # Individual time
                 has_children=member.has_children,
                 has_elderly=False,
                 is_round_trip=is_round_trip,
-                db=db
+                sunset="20:00",  # only affects warnings, not the time
+                include_segments=False
             )
 
             member_predictions.append({
@@ -430,7 +492,7 @@ class PredictionService:
 
         # Long hike warning
         if duration_hours > 8:
-            warnings.append(Warning(
+            warnings.append(Warning.from_trusted(
                 level=WarningLevel.INFO,
                 code="long_hike",
                 message="Long hike (8+ hours). Bring enough water and food."
@@ -438,7 +500,7 @@ class PredictionService:
 
         # High altitude warning
         if max_altitude_m > 3000:
-            warnings.append(Warning(
+            warnings.append(Warning.from_trusted(
                 level=WarningLevel.WARNING,
                 code="high_altitude",
                 message=f"Route reaches {int(max_altitude_m)}m. Watch for altitude sickness symptoms."
@@ -447,7 +509,7 @@ class PredictionService:
         # Late return warning
         sunset_hour = int(sunset.split(":")[0])
         if duration_hours > sunset_hour - 6:  # Starting at 6 AM
-            warnings.append(Warning(
+            warnings.append(Warning.from_trusted(
                 level=WarningLevel.DANGER,
                 code="late_return",
                 message="Risk of returning after dark. Start early or choose shorter route."
@@ -457,47 +519,64 @@ class PredictionService:
 
     @staticmethod
     def _calculate_segments(
-        gpx_content: bytes,
+        gpx_file,
         multiplier: float,
-        user_profile: Optional[UserPerformanceProfile] = None
+        user_profile: Optional[UserPerformanceProfile] = None,
+        gpx_segments: Optional[List[GPXSegment]] = None
     ) -> List[SegmentPrediction]:
         """
         Calculate time predictions for each route segment.
 
         Args:
-            gpx_content: Raw GPX file content
+            gpx_file: GPX file; its content is only read (and cached as
+                segments) when gpx_segments is None
             multiplier: Total time multiplier from profile
             user_profile: Optional user profile for personalized segment times
+            gpx_segments: Already parsed segments from the segments cache
 
         Returns:
             List of SegmentPrediction with times
         """
-        if not gpx_content:
-            return []
-
-        try:
-            points = GPXParserService.extract_points(gpx_content)
-            gpx_segments = GPXParserService.segment_route(points)
-        except Exception as e:
-            logger.warning(f"Failed to segment route: {e}")
-            return []
+        if gpx_segments is None:
+            gpx_content = gpx_file.content
+            if not gpx_content:
+                return []
+
+            try:
+                points = GPXParserService.extract_points(gpx_content)
+                gpx_segments = GPXParserService.segment_route(points)
+            except Exception as e:
+                logger.warning(f"Failed to segment route: {e}")
+                return []
+
+            _segments_cache[gpx_file.id] = gpx_segments
+            if len(_segments_cache) > _SEGMENTS_CACHE_SIZE:
+                _segments_cache.popitem(last=False)
+
+        # Profile paces are the same for every segment: read them once
+        # rather than through the ORM attributes on each iteration
+        use_split_paces = bool(user_profile and user_profile.has_split_data)
+        if use_split_paces:
+            uphill_pace = user_profile.avg_uphill_pace_min_km
+            downhill_pace = user_profile.avg_downhill_pace_min_km
+            flat_pace = user_profile.avg_flat_pace_min_km
 
         segment_predictions = []
         for seg in gpx_segments:
             # Determine speed based on segment gradient and user profile
-            if user_profile and user_profile.has_split_data:
+            if use_split_paces:
                 # Use personalized pace based on gradient
                 gradient = seg.gradient_percent or 0
 
                 if gradient > 3:
                     # Uphill
-                    pace = user_profile.avg_uphill_pace_min_km
+                    pace = uphill_pace
                 elif gradient < -3:
                     # Downhill
-                    pace = user_profile.avg_downhill_pace_min_km
+                    pace = downhill_pace
                 else:
                     # Flat
-                    pace = user_profile.avg_flat_pace_min_km
+                    pace = flat_pace
 
                 if pace:
                     base_minutes = seg.distance_km * pace
@@ -519,7 +598,7 @@ class PredictionService:
             # Apply profile multiplier
             predicted_minutes = base_minutes * multiplier
 
-            segment_predictions.append(SegmentPrediction(
+            segment_predictions.append(SegmentPrediction.from_trusted(
                 start_km=seg.start_km,
                 end_km=seg.end_km,
                 distance_km=seg.distance_km,
@@ -7,6 +7,7 @@ Calculate sunrise and sunset times based on location.
 import logging
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
 
 from astral import LocationInfo
@@ -15,7 +16,7 @@ from astral.sun import sun
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SunTimes:
     """Sunrise and sunset times."""
     sunrise: str  # HH:MM format
@@ -42,6 +43,17 @@ def get_sun_times(
     if date_ is None:
         date_ = date.today()
 
+    return _sun_times_for_day(lat, lon, date_)
+
+
+@lru_cache(maxsize=256)
+def _sun_times_for_day(lat: float, lon: float, date_: date) -> SunTimes:
+    """
+    Sun times for one location and day.
+
+    Cached: routes are predicted repeatedly from the same start point on
+    the same day, and the solar calculation is the same every time.
+    """
     # Create location without timezone (astral handles UTC)
     location = LocationInfo(
         name="Route",
@@ -6,8 +6,10 @@ to avoid circular dependencies.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 from typing import List, Optional
 import math
 
@@ -47,7 +49,7 @@ class EffortLevel(str, Enum):
         return EFFORT_PERCENTILES[self.value]
 
 
-@dataclass
+@dataclass(slots=True)
 class MacroSegment:
     """
     A macro-segment of a route (major ascent or descent section).
@@ -81,7 +83,7 @@ class MacroSegment:
         return math.degrees(math.atan(self.gradient_percent / 100))
 
 
-@dataclass
+@dataclass(slots=True)
 class MethodResult:
     """Result from a single calculation method for a segment."""
     method_name: str
@@ -90,6 +92,44 @@ class MethodResult:
     formula_used: str  # Human-readable formula explanation
 
 
+class MethodResultBatch(Sequence):
+    """
+    Per-segment results of a calculate_route, built lazily.
+
+    Segment times are computed up front; the MethodResult for a segment
+    (with its formula string) is only built when that item is accessed,
+    so callers that just need the total never pay for it.
+
+    Items are built with build(segment), e.g. a calculate_segment bound
+    to the route's profile multiplier or base method name.
+    """
+
+    __slots__ = ("_build", "_segments", "_results", "times_hours")
+
+    def __init__(
+        self,
+        build: Callable[[MacroSegment], MethodResult],
+        segments: List[MacroSegment],
+        times_hours: List[float]
+    ):
+        self._build = build
+        self._segments = segments
+        self._results: List[Optional[MethodResult]] = [None] * len(segments)
+        self.times_hours = times_hours
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        result = self._results[index]
+        if result is None:
+            result = self._build(self._segments[index])
+            self._results[index] = result
+        return result
+
+
 @dataclass
 class SegmentCalculation:
     """Calculation results for one macro-segment."""
@@ -160,27 +200,55 @@ class PaceCalculator(ABC):
         """
         pass
 
-    def calculate_route(
+    def segment_hours(
+        self,
+        segment: MacroSegment,
+        profile_multiplier: float = 1.0
+    ) -> float:
+        """
+        Time in hours for a single macro-segment.
+
+        Same value as calculate_segment(...).time_hours. Calculators with a
+        closed-form time override this to skip building the MethodResult
+        and its formula string.
+        """
+        return self.calculate_segment(segment, profile_multiplier).time_hours
+
+    def calculate_route_hours(
         self,
         segments: List[MacroSegment],
         profile_multiplier: float = 1.0
-    ) -> tuple:
+    ) -> List[float]:
         """
-        Calculate total time for a route.
+        Per-segment times in hours, for callers that don't need MethodResults.
 
         Args:
             segments: List of macro-segments
             profile_multiplier: Multiplier from hiker profile
 
         Returns:
-            Tuple of (total_hours, list of segment results)
+            Time in hours for each segment, in order
+        """
+        segment_hours = self.segment_hours
+        return [segment_hours(segment, profile_multiplier) for segment in segments]
+
+    def calculate_route(
+        self,
+        segments: List[MacroSegment],
+        profile_multiplier: float = 1.0
+    ) -> tuple[float, MethodResultBatch]:
         """
-        results = []
-        total_hours = 0.0
+        Calculate total time for a route.
 
-        for segment in segments:
-            result = self.calculate_segment(segment, profile_multiplier)
-            results.append(result)
-            total_hours += result.time_hours
+        Args:
+            segments: List of macro-segments
+            profile_multiplier: Multiplier from hiker profile
 
-        return total_hours, results
+        Returns:
+            Tuple of (total_hours, segment results). The results are a
+            lazy sequence of MethodResult, built on access.
+        """
+        times_hours = self.calculate_route_hours(segments, profile_multiplier)
+        build = partial(self.calculate_segment, profile_multiplier=profile_multiplier)
+        batch = MethodResultBatch(build, segments, times_hours)
+        return sum(times_hours), batch
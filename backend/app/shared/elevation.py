@@ -3,6 +3,7 @@ Elevation processing utilities.
 
 This is the SINGLE SOURCE OF TRUTH for elevation calculations.
 """
+from itertools import pairwise
 from typing import List, Tuple
 
 # Default smoothing window size (should be odd)
@@ -26,14 +27,24 @@ def smooth_elevations(
     if len(elevations) < window_size:
         return elevations
 
-    smoothed = []
+    n = len(elevations)
     half_window = window_size // 2
+    width = 2 * half_window + 1
 
-    for i in range(len(elevations)):
-        start = max(0, i - half_window)
-        end = min(len(elevations), i + half_window + 1)
-        window = elevations[start:end]
-        smoothed.append(sum(window) / len(window))
+    def clipped_mean(i: int) -> float:
+        # Near the ends the window is cut off by the track bounds
+        window = elevations[max(0, i - half_window):min(n, i + half_window + 1)]
+        return sum(window) / len(window)
+
+    if n <= width:
+        return [clipped_mean(i) for i in range(n)]
+
+    smoothed = [clipped_mean(i) for i in range(half_window)]
+    smoothed.extend(
+        sum(elevations[start:start + width]) / width
+        for start in range(n - width + 1)
+    )
+    smoothed.extend(clipped_mean(i) for i in range(n - half_window, n))
 
     return smoothed
 
@@ -53,11 +64,11 @@ def calculate_elevation_changes(
     gain = 0.0
     loss = 0.0
 
-    for i in range(1, len(elevations)):
-        diff = elevations[i] - elevations[i - 1]
+    for prev, current in pairwise(elevations):
+        diff = current - prev
         if diff > 0:
             gain += diff
         else:
-            loss += abs(diff)
+            loss -= diff
 
     return gain, loss
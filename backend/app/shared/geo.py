@@ -5,6 +5,7 @@ This is the SINGLE SOURCE OF TRUTH for geographic calculations.
 DO NOT duplicate these functions elsewhere.
 """
 import math
+from itertools import accumulate
 
 # Earth radius in kilometers
 EARTH_RADIUS_KM = 6371.0
@@ -39,6 +40,59 @@ def haversine(
     return EARTH_RADIUS_KM * c
 
 
+def step_distances(points: list[tuple[float, float, float]]) -> list[float]:
+    """
+    Great-circle distance of each step between consecutive route points.
+
+    Same per-step arithmetic as haversine(), but each point's latitude
+    cosine is computed once and shared by the two steps touching it.
+
+    Args:
+        points: List of (lat, lon, elevation) tuples
+
+    Returns:
+        Distances in kilometers, one value per step (len(points) - 1)
+    """
+    if not points:
+        return []
+
+    radians, sin, cos, sqrt, atan2 = math.radians, math.sin, math.cos, math.sqrt, math.atan2
+
+    prev_lat, prev_lon, _ = points[0]
+    prev_cos = cos(radians(prev_lat))
+    result = []
+
+    for i in range(1, len(points)):
+        lat, lon, _ = points[i]
+        lat_cos = cos(radians(lat))
+
+        a = (
+            sin(radians(lat - prev_lat) / 2) ** 2 +
+            prev_cos * lat_cos *
+            sin(radians(lon - prev_lon) / 2) ** 2
+        )
+        result.append(EARTH_RADIUS_KM * (2 * atan2(sqrt(a), sqrt(1 - a))))
+
+        prev_lat, prev_lon, prev_cos = lat, lon, lat_cos
+
+    return result
+
+
+def cumulative_distances(points: list[tuple[float, float, float]]) -> list[float]:
+    """
+    Cumulative great-circle distance at each point of a route.
+
+    Args:
+        points: List of (lat, lon, elevation) tuples
+
+    Returns:
+        Distance in kilometers from the first point, one value per point
+    """
+    if not points:
+        return []
+    return list(accumulate(step_distances(points), initial=0.0))
+
+
 def calculate_gradient(
     distance_km: float,
     elevation_diff_m: float
@@ -11,6 +11,8 @@ Naming convention: {direction}_{lower}_{upper} or {direction}_{bound}_over
 Examples: up_8_12 = uphill 8% to 12%, down_23_over = downhill steeper than -23%
 """
 
+from bisect import bisect_right
+
 # 11-category gradient thresholds (~5% bins)
 GRADIENT_THRESHOLDS = {
     'down_23_over': (-100.0, -23.0),   # < -23% (scrambling)
@@ -37,6 +39,9 @@ LEGACY_GRADIENT_THRESHOLDS = {
     'steep_uphill': (15.0, 100.0),
 }
 
+# Legacy categories in gradient order (steepest downhill -> steepest uphill)
+LEGACY_CATEGORIES = tuple(LEGACY_GRADIENT_THRESHOLDS)
+
 # Mapping: 11 new categories -> 7 legacy categories
 LEGACY_CATEGORY_MAPPING = {
     'down_23_over': 'steep_downhill',
@@ -57,6 +62,24 @@ FLAT_GRADIENT_MIN = -3.0  # %
 FLAT_GRADIENT_MAX = 3.0   # %
 
 
+# Bisection tables derived from GRADIENT_THRESHOLDS: the upper bound of
+# every category but the last, and the categories (11-cat and legacy) in
+# the same order. Bins are [min, max), so bisect_right picks the bin.
+_CATEGORY_UPPER_BOUNDS = tuple(
+    max_grad for min_grad, max_grad in list(GRADIENT_THRESHOLDS.values())[:-1]
+)
+_CATEGORIES = tuple(GRADIENT_THRESHOLDS)
+_LEGACY_BY_CATEGORY_INDEX = tuple(LEGACY_CATEGORY_MAPPING[c] for c in _CATEGORIES)
+_FLAT_CATEGORY_INDEX = _CATEGORIES.index('flat_3_3')
+
+
+def _category_index(gradient_percent: float) -> int:
+    """Index into _CATEGORIES for a gradient; out-of-range values clamp to the extremes."""
+    if gradient_percent != gradient_percent:  # NaN matches no bin
+        return _FLAT_CATEGORY_INDEX
+    return bisect_right(_CATEGORY_UPPER_BOUNDS, gradient_percent)
+
+
 def classify_gradient(gradient_percent: float) -> str:
     """
     Classify gradient into one of 11 categories.
@@ -67,15 +90,7 @@ def classify_gradient(gradient_percent: float) -> str:
     Returns:
         Category name (e.g., 'up_8_12', 'down_23_over', 'flat_3_3')
     """
-    for category, (min_grad, max_grad) in GRADIENT_THRESHOLDS.items():
-        if min_grad <= gradient_percent < max_grad:
-            return category
-    # Edge cases: values at or beyond extreme boundaries
-    if gradient_percent >= 23.0:
-        return 'up_23_over'
-    if gradient_percent <= -23.0:
-        return 'down_23_over'
-    return 'flat_3_3'
+    return _CATEGORIES[_category_index(gradient_percent)]
 
 
 def classify_gradient_legacy(gradient_percent: float) -> str:
@@ -90,4 +105,4 @@ def classify_gradient_legacy(gradient_percent: float) -> str:
     Returns:
         Legacy category name (e.g., 'steep_uphill', 'gentle_downhill', 'flat')
     """
-    return LEGACY_CATEGORY_MAPPING[classify_gradient(gradient_percent)]
+    return _LEGACY_BY_CATEGORY_INDEX[_category_index(gradient_percent)]
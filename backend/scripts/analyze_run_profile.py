@@ -253,7 +253,7 @@ def main():
             print("Talgar Trail not found!")
             return
 
-        gpx = gpxpy.parse(gpx_file.gpx_content.decode('utf-8'))
+        gpx = gpxpy.parse(gpx_file.content.decode('utf-8'))
         points = []
         for track in gpx.tracks:
             for segment in track.segments:
@@ -340,7 +340,7 @@ def main():
 
         for gpx_f in unique_gpx[:10]:
             try:
-                gpx_data = gpxpy.parse(gpx_f.gpx_content.decode('utf-8'))
+                gpx_data = gpxpy.parse(gpx_f.content.decode('utf-8'))
                 pts = []
                 for track in gpx_data.tracks:
                     for segment in track.segments:
@@ -132,11 +132,12 @@ def main():
 
     with Session(engine) as db:
         gpx_file = load_gpx_from_db(db, "talgar")
-        if not gpx_file or not gpx_file.gpx_content:
+        content = gpx_file.content if gpx_file else None
+        if not content:
             print("Talgar Trail GPX not found!")
             return
 
-        points = parse_gpx_content(gpx_file.gpx_content)
+        points = parse_gpx_content(content)
         segments = RouteSegmenter.segment_route(points)
         total_distance = sum(s.distance_km for s in segments)
 
@@ -277,12 +277,13 @@ def main():
             GPXFile.name.ilike("%talgar%")
         ).first()
 
-        if not gpx_file or not gpx_file.gpx_content:
+        content = gpx_file.content if gpx_file else None
+        if not content:
             print("Talgar Trail GPX not found!")
             return
 
         # Parse points
-        gpx = gpxpy.parse(gpx_file.gpx_content.decode('utf-8'))
+        gpx = gpxpy.parse(content.decode('utf-8'))
         points = []
         for track in gpx.tracks:
             for segment in track.segments:
@@ -124,13 +124,14 @@ def main():
         print(f"  Elevation loss: -{gpx_file.elevation_loss_m:.0f}m" if gpx_file.elevation_loss_m else "")
         print()
 
-        if not gpx_file.gpx_content:
+        content = gpx_file.content
+        if not content:
             print("GPX content is empty!")
             return
 
         # Parse GPX
         print("Parsing GPX content...")
-        points = parse_gpx_content(gpx_file.gpx_content)
+        points = parse_gpx_content(content)
         print(f"  Extracted {len(points)} points")
         print()
 
@@ -241,7 +241,7 @@ def main():
     with Session(engine) as db:
         # Load Talgar Trail
         gpx_file = load_gpx_from_db(db, "talgar")
-        if not gpx_file or not gpx_file.gpx_content:
+        if not gpx_file or not gpx_file.content:
             print("Talgar Trail GPX not found!")
             return
 
@@ -251,7 +251,7 @@ def main():
         print()
 
         # Parse and segment
-        points = parse_gpx_content(gpx_file.gpx_content)
+        points = parse_gpx_content(gpx_file.content)
         segments = RouteSegmenter.segment_route(points)
 
         total_distance = sum(s.distance_km for s in segments)
@@ -70,11 +70,11 @@ def main():
 
     with Session(engine) as db:
         gpx_file = load_gpx_from_db(db, "talgar")
-        if not gpx_file or not gpx_file.gpx_content:
+        if not gpx_file or not gpx_file.content:
             print("Talgar Trail GPX not found!")
             return
 
-        points = parse_gpx_content(gpx_file.gpx_content)
+        points = parse_gpx_content(gpx_file.content)
 
         print(f"Track: {gpx_file.name}")
         print(f"Points: {len(points)}")
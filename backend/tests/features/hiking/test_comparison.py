@@ -0,0 +1,110 @@
+"""
+Tests for ComparisonService totals, text formatting and personalization reuse.
+"""
+
+import math
+from datetime import datetime
+
+import pytest
+from sqlalchemy import inspect
+
+from app.services.calculators.comparison import (
+    ComparisonService,
+    _get_personalization,
+)
+from app.shared.calculator_types import EffortLevel
+from app.models.user_profile import UserHikingProfile
+
+
+@pytest.fixture
+def long_route():
+    """~33 km of rolling climbs and descents: long enough for fatigue to kick in."""
+    return [
+        (43.0 + i * 0.0005, 76.9, 1500 + 400 * math.sin(i / 40))
+        for i in range(600)
+    ]
+
+
+class TestFormatTime:
+    """Tests for ComparisonService._format_time."""
+
+    @pytest.mark.parametrize("hours, expected", [
+        (0.0, "0мин"),
+        (0.5, "30мин"),
+        (0.999, "1ч 0мин"),
+        (1.0, "1ч 0мин"),
+        (1.126, "1ч 8мин"),
+        (2.5, "2ч 30мин"),
+    ])
+    def test_format_time(self, hours, expected):
+        """Minutes are rounded and carried into hours."""
+        assert ComparisonService._format_time(hours) == expected
+
+
+class TestPersonalizationCache:
+    """Tests for reuse of cached personalization services."""
+
+    def test_reused_until_profile_recalculated(self):
+        """Services are cached per profile version and extended-gradients flag."""
+        profile = UserHikingProfile(
+            user_id="user-1",
+            avg_flat_pace_min_km=11.0,
+            total_activities_analyzed=5,
+            last_calculated_at=datetime(2025, 1, 1),
+        )
+
+        services = _get_personalization(profile, True)
+
+        assert set(services) == set(EffortLevel)
+        assert _get_personalization(profile, True) is services
+        assert _get_personalization(profile, False) is not services
+
+        profile.last_calculated_at = datetime(2025, 1, 2)
+        assert _get_personalization(profile, True) is not services
+
+    def test_does_not_hold_orm_profile(self):
+        """Cached services keep a detached copy, not the session-bound profile."""
+        profile = UserHikingProfile(
+            user_id="user-3",
+            avg_flat_pace_min_km=11.0,
+            gradient_paces={"flat_3_3": {"avg": 11.0, "samples": 9}},
+            total_activities_analyzed=4,
+            last_calculated_at=datetime(2025, 3, 1),
+        )
+
+        services = _get_personalization(profile, True)
+
+        for service in services.values():
+            assert service.profile is not profile
+            assert inspect(service.profile).session is None
+            assert service.profile.avg_flat_pace_min_km == 11.0
+            assert service.profile.gradient_paces == profile.gradient_paces
+            assert service.profile.gradient_paces is not profile.gradient_paces
+
+
+class TestCompareRouteTotals:
+    """Tests for compare_route with include_segments=False."""
+
+    @pytest.mark.parametrize("apply_fatigue", [False, True])
+    @pytest.mark.parametrize("with_profile", [False, True])
+    def test_totals_only_matches_full_comparison(self, long_route, apply_fatigue, with_profile):
+        """Skipping segment output does not change totals or distance."""
+        profile = None
+        if with_profile:
+            profile = UserHikingProfile(
+                user_id="user-2",
+                avg_flat_pace_min_km=11.0,
+                avg_uphill_pace_min_km=18.0,
+                avg_downhill_pace_min_km=10.0,
+                total_activities_analyzed=7,
+            )
+        service = ComparisonService()
+        kwargs = dict(user_profile=profile, use_extended_gradients=False, apply_fatigue=apply_fatigue)
+
+        full = service.compare_route(long_route, 1.1, **kwargs)
+        totals_only = service.compare_route(long_route, 1.1, include_segments=False, **kwargs)
+
+        assert full.segments
+        assert totals_only.segments == []
+        assert totals_only.totals == full.totals
+        assert totals_only.total_distance_km == full.total_distance_km
@@ -0,0 +1,83 @@
+"""
+Tests for HikeFatigueService.
+"""
+
+import pytest
+
+from app.features.hiking.calculators.fatigue import (
+    HikeFatigueService,
+    FATIGUE_THRESHOLD_HOURS,
+)
+
+
+@pytest.fixture
+def segment_times():
+    """Segment times crossing the fatigue threshold, incl. one exactly at it."""
+    return [1.0, 2.0, 0.0, 1.5, 2.25, 0.75, 3.0]
+
+
+class TestHikeFatigueService:
+    """Tests for HikeFatigueService route and multiplier helpers."""
+
+    def test_apply_to_route_matches_per_segment(self, segment_times):
+        """apply_to_route equals chaining apply_to_segment over the route."""
+        service = HikeFatigueService.create_enabled()
+
+        expected_times, expected_mults = [], []
+        cumulative = 0.0
+        for base_time in segment_times:
+            adjusted, mult = service.apply_to_segment(base_time, cumulative)
+            expected_times.append(adjusted)
+            expected_mults.append(mult)
+            cumulative += adjusted
+
+        adjusted_times, multipliers, total = service.apply_to_route(segment_times)
+
+        assert adjusted_times == expected_times
+        assert multipliers == expected_mults
+        assert total == cumulative
+        assert multipliers[0] == 1.0
+        assert multipliers[-1] > 1.0
+
+
+    def test_apply_to_route_disabled(self, segment_times):
+        """A disabled service returns the times unchanged."""
+        adjusted_times, multipliers, total = HikeFatigueService().apply_to_route(segment_times)
+
+        assert adjusted_times == segment_times
+        assert multipliers == [1.0] * len(segment_times)
+        assert total == sum(segment_times)
+
+
+    def test_no_fatigue_at_threshold(self):
+        """Elapsed time exactly at the threshold gets no penalty."""
+        service = HikeFatigueService.create_enabled()
+
+        assert service.calculate_multiplier(FATIGUE_THRESHOLD_HOURS) == 1.0
+        # Midpoint of a 6h segment is exactly the threshold
+        assert service.apply_to_route([2 * FATIGUE_THRESHOLD_HOURS])[1] == [1.0]
+
+
+    def test_calculate_multipliers_matches_scalar(self):
+        """calculate_multipliers matches calculate_multiplier element-wise."""
+        service = HikeFatigueService.create_enabled()
+        elapsed = [0.0, 2.5, FATIGUE_THRESHOLD_HOURS, 3.5, 6, 10.25]
+
+        assert service.calculate_multipliers(elapsed) == [
+            service.calculate_multiplier(e) for e in elapsed
+        ]
+        assert HikeFatigueService().calculate_multipliers(elapsed) == [1.0] * len(elapsed)
+
+
+    def test_fatigue_info_examples(self):
+        """Example multipliers are correct and not shared between calls."""
+        info = HikeFatigueService.create_enabled().get_fatigue_info()
+        examples = info["example_multipliers"]
+
+        assert examples["3h"] == 1.0
+        assert examples["5h"] == 1.08
+        assert examples["10h"] == 1.455
+
+        # Each call gets its own dict
+        examples["3h"] = 99
+        assert HikeFatigueService.create_enabled().get_fatigue_info()["example_multipliers"]["3h"] == 1.0
@@ -0,0 +1,81 @@
+"""
+Tests for the Tobler and Naismith pace calculators.
+
+Focus: the formula-free segment_hours / calculate_route_hours path must
+return exactly what calculate_segment reports.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services.calculators.base import MacroSegment, SegmentType
+from app.features.hiking.calculators import ToblerCalculator, NaismithCalculator
+
+
+def _segment(number, segment_type, distance_km, gain_m, loss_m):
+    return MacroSegment(
+        segment_number=number,
+        segment_type=segment_type,
+        distance_km=distance_km,
+        elevation_gain_m=gain_m,
+        elevation_loss_m=loss_m,
+        start_elevation_m=1000,
+        end_elevation_m=1000 + gain_m - loss_m,
+    )
+
+
+@pytest.fixture
+def route():
+    """Flat, ascent, gentle/steep/very gentle descents and a zero-length segment."""
+    return [
+        _segment(1, SegmentType.FLAT, 2.0, 15, 10),
+        _segment(2, SegmentType.ASCENT, 3.5, 620, 20),
+        _segment(3, SegmentType.DESCENT, 4.0, 0, 450),    # ~6 deg: gentle
+        _segment(4, SegmentType.DESCENT, 1.2, 0, 380),    # ~17 deg: steep
+        _segment(5, SegmentType.DESCENT, 5.0, 0, 60),     # <5 deg: no correction
+        _segment(6, SegmentType.FLAT, 0.0, 0, 0),
+    ]
+
+
+class TestToblerNaismithSegmentHours:
+    """Tests for segment_hours on the Tobler and Naismith calculators."""
+
+    @pytest.mark.parametrize("calculator_cls", [ToblerCalculator, NaismithCalculator])
+    @pytest.mark.parametrize("multiplier", [1.0, 1.35])
+    def test_matches_calculate_segment(self, calculator_cls, multiplier, route):
+        """segment_hours equals calculate_segment().time_hours for every segment."""
+        calculator = calculator_cls()
+        for segment in route:
+            expected = calculator.calculate_segment(segment, multiplier).time_hours
+            assert calculator.segment_hours(segment, multiplier) == expected
+
+
+class TestCalculateRoute:
+    """Tests for calculate_route / calculate_route_hours."""
+
+    @pytest.mark.parametrize("calculator_cls", [ToblerCalculator, NaismithCalculator])
+    def test_hours_match_calculate_route(self, calculator_cls, route):
+        """calculate_route_hours returns the per-segment times of calculate_route."""
+        calculator = calculator_cls()
+        total_hours, results = calculator.calculate_route(route, 1.2)
+
+        hours = calculator.calculate_route_hours(route, 1.2)
+
+        assert hours == [r.time_hours for r in results]
+        assert sum(hours) == total_hours
+
+    def test_builds_results_lazily(self, route):
+        """MethodResults are built only for the segments that are accessed."""
+        calculator = NaismithCalculator()
+
+        with patch.object(calculator, "calculate_segment", wraps=calculator.calculate_segment) as spy:
+            total_hours, results = calculator.calculate_route(route)
+
+            assert spy.call_count == 0
+            assert len(results) == len(route)
+            assert total_hours == sum(results.times_hours)
+
+            assert results[1].method_name == "naismith"
+            assert results[-1] is results[len(route) - 1]
+            assert [c.args[0].segment_number for c in spy.call_args_list] == [2, 6]
@@ -8,7 +8,7 @@ Tests both:
 """
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call, patch
 
 from app.services.calculators.base import MacroSegment, SegmentType
 from app.features.hiking.calculators.personalization_base import (
@@ -259,6 +259,46 @@ class TestHikePersonalizationService:
         assert total_hours > 0
         assert total_hours == sum(r.time_hours for r in results)
 
+    @pytest.mark.parametrize("extended", [False, True])
+    def test_calculate_route_hours(
+        self, mock_profile, flat_segment, uphill_segment, downhill_segment, extended
+    ):
+        """Test formula-free route hours match calculate_segment."""
+        service = HikePersonalizationService(mock_profile, use_extended_gradients=extended)
+        segments = [flat_segment, uphill_segment, downhill_segment]
+
+        expected = [service.calculate_segment(s).time_hours for s in segments]
+
+        assert service.calculate_route_hours(segments) == expected
+
+    def test_calculate_route_builds_results_lazily(
+        self, mock_profile, flat_segment, uphill_segment, downhill_segment
+    ):
+        """Test MethodResults are only built for accessed segments."""
+        service = HikePersonalizationService(mock_profile)
+        segments = [flat_segment, uphill_segment, downhill_segment]
+
+        with patch.object(service, "calculate_segment", wraps=service.calculate_segment) as spy:
+            total_hours, results = service.calculate_route(segments, base_method="naismith")
+
+            assert spy.call_count == 0
+            assert total_hours == sum(results.times_hours)
+            assert results[1].method_name == "naismith_personalized"
+            assert spy.call_args_list == [call(uphill_segment, base_method="naismith")]
+
+    def test_category_pace_resolved_once(self, mock_profile, flat_segment, uphill_segment):
+        """Test each gradient category's profile pace is looked up once per service."""
+        service = HikePersonalizationService(mock_profile, use_extended_gradients=True)
+
+        with patch.object(
+            service, "_get_pace_for_category", wraps=service._get_pace_for_category
+        ) as spy:
+            first = service.calculate_route_hours([flat_segment, uphill_segment])
+            second = service.calculate_route_hours([uphill_segment, flat_segment])
+
+        assert second == first[::-1]
+        assert spy.call_count == 2
+
     def test_fallback_to_tobler_estimation(self, mock_minimal_profile, uphill_segment):
         """Test fallback to Tobler when profile data is missing."""
         service = HikePersonalizationService(mock_minimal_profile, use_extended_gradients=True)
@@ -0,0 +1,52 @@
+"""
+Tests for shared elevation functions.
+
+Tests moving-average smoothing and gain/loss totals.
+"""
+
+import pytest
+
+from app.shared.elevation import smooth_elevations, calculate_elevation_changes
+
+
+class TestSmoothElevations:
+    """Tests for smooth_elevations function."""
+
+    def test_short_input_unchanged(self):
+        """Fewer points than the window are returned as-is."""
+        elevations = [100.0, 110.0, 105.0]
+        assert smooth_elevations(elevations, 5) is elevations
+
+    def test_window_clipped_at_ends(self):
+        """Edge points average over the part of the window inside the track."""
+        elevations = [0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0]
+        smoothed = smooth_elevations(elevations, 5)
+
+        assert smoothed[0] == pytest.approx(10.0)   # mean of 0, 10, 20
+        assert smoothed[1] == pytest.approx(15.0)   # mean of 0..30
+        assert smoothed[3] == pytest.approx(30.0)   # full window
+        assert smoothed[-1] == pytest.approx(50.0)  # mean of 40, 50, 60
+
+    @pytest.mark.parametrize("window_size", [1, 2, 3, 4, 5, 7])
+    @pytest.mark.parametrize("n", [7, 8, 9, 25])
+    def test_matches_clipped_window_mean(self, window_size, n):
+        """Every value is the mean of its (clipped) window."""
+        elevations = [float((i * 37) % 11) * 12.5 for i in range(n)]
+        half = window_size // 2
+
+        expected = []
+        for i in range(n):
+            window = elevations[max(0, i - half):i + half + 1]
+            expected.append(sum(window) / len(window))
+
+        assert smooth_elevations(elevations, window_size) == expected
+
+
+class TestElevationChanges:
+    """Tests for calculate_elevation_changes function."""
+
+    def test_gain_and_loss(self):
+        assert calculate_elevation_changes([100, 150, 120, 200]) == (130, 30)
+
+    def test_empty(self):
+        assert calculate_elevation_changes([]) == (0.0, 0.0)
@@ -13,6 +13,8 @@ from app.shared.geo import (
     gradient_to_percent,
     gradient_to_degrees,
     calculate_total_distance,
+    cumulative_distances,
+    step_distances,
     EARTH_RADIUS_KM,
 )
 
@@ -256,3 +258,53 @@ class TestEdgeCases:
         grad = calculate_gradient(-1.0, 100.0)
         # Returns 0 because distance <= 0
         assert grad == 0.0
+
+
+# =============================================================================
+# Test Cumulative Distances
+# =============================================================================
+
+class TestCumulativeDistances:
+    """Tests for cumulative_distances function."""
+
+    def test_empty(self):
+        """No points, no distances."""
+        assert cumulative_distances([]) == []
+
+    def test_single_point(self):
+        """Single point starts at zero."""
+        assert cumulative_distances([(43.0, 76.0, 1000)]) == [0.0]
+
+    def test_matches_haversine_sum(self):
+        """Each value is exactly the running sum of haversine steps."""
+        points = [
+            (43.0, 76.0, 1000),
+            (43.0012, 76.0031, 1010),
+            (43.0012, 76.0031, 1010),  # duplicate point
+            (42.9987, 76.0102, 980),
+            (-12.5, 130.2, 5),
+            (-12.5001, -179.9, 0),
+        ]
+        expected = [0.0]
+        for (lat1, lon1, _), (lat2, lon2, _) in zip(points, points[1:]):
+            expected.append(expected[-1] + haversine(lat1, lon1, lat2, lon2))
+
+        assert cumulative_distances(points) == expected
+        assert cumulative_distances(points)[-1] == calculate_total_distance(points)
+
+    def test_step_distances_match_haversine(self):
+        """Each step is exactly haversine between consecutive points."""
+        points = [
+            (43.0, 76.0, 1000),
+            (43.0012, 76.0031, 1010),
+            (43.0012, 76.0031, 1010),
+            (-12.5001, -179.9, 0),
+        ]
+        expected = [
+            haversine(lat1, lon1, lat2, lon2)
+            for (lat1, lon1, _), (lat2, lon2, _) in zip(points, points[1:])
+        ]
+
+        assert step_distances(points) == expected
+        assert step_distances(points[:1]) == []
+        assert step_distances([]) == []
@@ -0,0 +1,48 @@
+"""
+Tests for shared gradient classification.
+
+Bins are half-open [min, max); values outside ±100% clamp to the
+extreme categories.
+"""
+
+import math
+
+import pytest
+
+from app.shared.gradients import (
+    GRADIENT_THRESHOLDS,
+    LEGACY_CATEGORY_MAPPING,
+    classify_gradient,
+    classify_gradient_legacy,
+)
+
+
+class TestClassifyGradient:
+    """Tests for classify_gradient / classify_gradient_legacy."""
+
+    @pytest.mark.parametrize("category", list(GRADIENT_THRESHOLDS))
+    def test_bin_boundaries(self, category):
+        """Lower bound is inclusive, upper bound exclusive."""
+        min_grad, max_grad = GRADIENT_THRESHOLDS[category]
+        assert classify_gradient(min_grad) == category
+        assert classify_gradient(math.nextafter(max_grad, -math.inf)) == category
+
+    @pytest.mark.parametrize("gradient, expected", [
+        (0.0, 'flat_3_3'),
+        (-3.0, 'flat_3_3'),
+        (3.0, 'up_3_8'),
+        (-23.0, 'down_23_17'),
+        (23.0, 'up_23_over'),
+        (100.0, 'up_23_over'),
+        (250.0, 'up_23_over'),
+        (-250.0, 'down_23_over'),
+        (math.inf, 'up_23_over'),
+        (-math.inf, 'down_23_over'),
+        (math.nan, 'flat_3_3'),
+    ])
+    def test_classify(self, gradient, expected):
+        assert classify_gradient(gradient) == expected
+
+    @pytest.mark.parametrize("gradient", [-150.0, -20.0, -10.0, -5.0, 0.0, 5.0, 10.0, 14.0, 20.0, 150.0, math.nan])
+    def test_legacy_follows_mapping(self, gradient):
+        assert classify_gradient_legacy(gradient) == LEGACY_CATEGORY_MAPPING[classify_gradient(gradient)]